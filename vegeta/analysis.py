@@ -0,0 +1,128 @@
+"""Vectorized analysis of vegeta results with NumPy.
+
+The first load of a result file decodes it once with `vegeta encode` and
+caches every column as a .npy file in <result>.cols/ next to it; later loads
+memory-map the cache. All statistics work on whole arrays.
+"""
+
+import io
+import shlex
+import shutil
+import subprocess
+from pathlib import Path
+
+import numpy as np
+
+# Leading CSV columns of `vegeta encode --to csv`, all integers
+COLUMNS = ('timestamp', 'code', 'latency', 'bytes_out', 'bytes_in')
+# Request URLs: per-result index into the array of distinct URLs
+URL_COLUMNS = ('url', 'urls')
+
+def _decode(vegeta_bin):
+    """Columns of a result file: int64 arrays, the URL index and the distinct URLs"""
+    # The first five CSV columns never contain commas or quotes and neither do
+    # the last three (method, url, base64 headers), so awk can keep the URL by
+    # counting from the end even when the error column contains commas
+    result = subprocess.run(
+        f"vegeta encode --to csv {shlex.quote(str(vegeta_bin))} | "
+        "awk -F, -v OFS=, '{print $1, $2, $3, $4, $5, $(NF - 1)}'",
+        shell=True,
+        capture_output=True,
+        check=True
+    )
+    if not result.stdout.strip():
+        columns = {name: np.empty(0, dtype=np.int64) for name in COLUMNS}
+        columns.update(url=np.empty(0, dtype=np.int64), urls=np.empty(0, dtype=str))
+        return columns
+
+    table = np.loadtxt(io.BytesIO(result.stdout), delimiter=',', dtype=np.int64, usecols=range(5), ndmin=2, comments=None)
+    columns = {name: np.ascontiguousarray(table[:, i]) for i, name in enumerate(COLUMNS)}
+    urls = np.loadtxt(io.BytesIO(result.stdout), delimiter=',', dtype=str, usecols=5, ndmin=1, comments=None)
+    columns['urls'], url = np.unique(urls, return_inverse=True)
+    columns['url'] = url.astype(np.int64)
+    return columns
+
+def load(vegeta_bin):
+    """Columns of a result file, memory-mapped from the cache when it is current"""
+    vegeta_bin = Path(vegeta_bin)
+    cache = vegeta_bin.with_name(vegeta_bin.name + '.cols')
+    names = COLUMNS + URL_COLUMNS
+    cached = [cache / f'{name}.npy' for name in names]
+
+    if not all(f.exists() and f.stat().st_mtime >= vegeta_bin.stat().st_mtime for f in cached):
+        columns = _decode(vegeta_bin)
+        try:
+            tmp = cache.with_name(cache.name + '.tmp')
+            shutil.rmtree(tmp, ignore_errors=True)
+            tmp.mkdir()
+            for name, values in columns.items():
+                np.save(tmp / f'{name}.npy', values)
+            shutil.rmtree(cache, ignore_errors=True)
+            tmp.rename(cache)
+        except OSError:
+            # Read-only result directory, e.g. written by another user
+            return columns
+
+    return {name: np.load(f, mmap_mode='r') for name, f in zip(names, cached)}
+
+def percentiles(latencies, pcts):
+    """Nearest-rank percentiles (same unit as latencies) of a non-empty array"""
+    # Smallest value with at least pct% of the samples at or below it
+    ranks = np.ceil(len(latencies) * np.asarray(pcts) / 100).astype(np.int64) - 1
+    ranks = np.clip(ranks, 0, len(latencies) - 1)
+    return np.partition(latencies, ranks)[ranks]
+
+def summary(results):
+    """Request rate, success rate and latency statistics (ms) of one attack
+
+    Same definitions as `vegeta report`: the rate is requests over the span
+    of request start times, 2xx and 3xx responses count as success.
+    """
+    timestamps, latencies, codes = results['timestamp'], results['latency'], results['code']
+    requests = len(timestamps)
+    if not requests:
+        return None
+
+    duration = (timestamps.max() - timestamps.min()) / 1_000_000_000
+    p50, p99 = percentiles(latencies, [50, 99]) / 1_000_000
+    return {
+        'latency_mean': round(float(latencies.mean()) / 1_000_000, 2),
+        'latency_50': round(float(p50), 2),
+        'latency_99': round(float(p99), 2),
+        'latency_max': round(float(latencies.max()) / 1_000_000, 2),
+        'rps': round(requests / duration, 2) if duration else 0.0,
+        'success': round(float(np.count_nonzero((codes >= 200) & (codes < 400))) * 100 / requests),
+        'total_requests': requests
+    }
+
+def window_counts(timestamps, window_ns, start_ns=None):
+    """Requests started per window_ns window from start_ns (default: first request)"""
+    if not len(timestamps):
+        return np.empty(0, dtype=np.int64)
+    start_ns = timestamps.min() if start_ns is None else start_ns
+    return np.bincount((np.asarray(timestamps) - start_ns) // window_ns)
+
+def histogram(latencies, bins=50):
+    """Latency histogram on log-spaced bins: (bin edges in ms, counts)"""
+    latencies_ms = np.asarray(latencies) / 1_000_000
+    low = max(latencies_ms.min(), 0.001)
+    edges = np.geomspace(low, max(latencies_ms.max(), low * 1.01), bins + 1)
+    counts, edges = np.histogram(np.clip(latencies_ms, low, None), bins=edges)
+    return edges, counts
+
+def in_intervals(starts, ends, interval_starts, interval_ends):
+    """Mask of the [starts, ends] spans overlapping any of the sorted, disjoint intervals"""
+    interval_starts = np.asarray(interval_starts)
+    interval_ends = np.asarray(interval_ends)
+    if not len(interval_starts):
+        return np.zeros(len(starts), dtype=bool)
+    # Only the last interval starting before a span ends can overlap it
+    i = np.searchsorted(interval_starts, ends, side='right') - 1
+    return (i >= 0) & (interval_ends[np.maximum(i, 0)] >= starts)
+
+def deltas(values, baseline):
+    """Percent change of every value against the baseline (NaN where it is 0)"""
+    values = np.asarray(values, dtype=float)
+    baseline = np.asarray(baseline, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(baseline != 0, (values - baseline) / baseline * 100, np.nan)
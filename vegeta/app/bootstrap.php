@@ -0,0 +1,25 @@
+<?php
+
+// Shared bootstrap for the app_* scripts: PSR-4 autoloading of the framework
+// code in src/ and of the classes generated by fixtures.php at build time.
+
+const APP_FIXTURES = '/srv/app';
+
+spl_autoload_register(function (string $class): void {
+    static $prefixes = [
+        'Bench\\Generated\\' => APP_FIXTURES . '/src/',
+        'Bench\\' => __DIR__ . '/src/',
+    ];
+
+    foreach ($prefixes as $prefix => $dir) {
+        if (strncmp($class, $prefix, strlen($prefix)) === 0) {
+            $file = $dir . str_replace('\\', '/', substr($class, strlen($prefix))) . '.php';
+            if (is_file($file)) {
+                require $file;
+            }
+            return;
+        }
+    }
+});
+
+return new Bench\Kernel(require APP_FIXTURES . '/config.php', __DIR__ . '/templates');
@@ -0,0 +1,19 @@
+<?php
+
+namespace Bench;
+
+final class Container
+{
+    private array $factories = [];
+    private array $instances = [];
+
+    public function set(string $id, callable $factory): void
+    {
+        $this->factories[$id] = $factory;
+    }
+
+    public function get(string $id): mixed
+    {
+        return $this->instances[$id] ??= ($this->factories[$id] ?? throw new \LogicException("Unknown service $id"))($this);
+    }
+}
@@ -0,0 +1,81 @@
+<?php
+
+namespace Bench\Controller;
+
+use Bench\Container;
+use Bench\Http\Request;
+use Bench\Http\Response;
+use Bench\Repository\ProductRepository;
+use Bench\Session\Session;
+use Bench\View\View;
+
+final class CatalogController
+{
+    private const RECENTLY_VIEWED = 10;
+
+    private readonly ProductRepository $products;
+    private readonly View $view;
+
+    public function __construct(private readonly Container $container)
+    {
+        $this->products = $container->get(ProductRepository::class);
+        $this->view = $container->get(View::class);
+    }
+
+    public function home(Request $request): Response
+    {
+        return new Response($this->view->render('home', [
+            'title' => 'Best rated',
+            'categories' => $this->products->categories(),
+            'products' => $this->products->bestRated(24),
+        ]));
+    }
+
+    public function category(Request $request, string $slug): Response
+    {
+        $category = $this->products->category($slug);
+        if ($category === null) {
+            return $this->notFound();
+        }
+
+        return new Response($this->view->render('home', [
+            'title' => $category['name'],
+            'categories' => $this->products->categories(),
+            'products' => $this->products->inCategory($category['id'], 24),
+        ]));
+    }
+
+    public function product(Request $request, string $id): Response
+    {
+        $product = $this->products->find((int) $id);
+        if ($product === null) {
+            return $this->notFound();
+        }
+
+        // Recently viewed products live in the session
+        $session = $this->container->get(Session::class);
+        $session->start($request->cookies['session'] ?? 'guest');
+        $recent = $session->get('recent', []);
+        $session->set('recent', array_slice(array_values(array_unique([$product['id'], ...$recent])), 0, self::RECENTLY_VIEWED));
+        $session->set('views', $session->get('views', 0) + 1);
+        $session->close();
+
+        return new Response($this->view->render('product', [
+            'title' => $product['name'],
+            'categories' => $this->products->categories(),
+            'product' => $product,
+            'rating' => $this->products->rating($product['id']),
+            'reviews' => $this->products->reviews($product['id'], 10),
+            'related' => $this->products->inCategory($product['category_id'], 4, $product['id']),
+            'recent' => $this->products->findMany(array_diff($recent, [$product['id']])),
+        ]));
+    }
+
+    private function notFound(): Response
+    {
+        return new Response($this->view->render('not_found', [
+            'title' => 'Not found',
+            'categories' => $this->products->categories(),
+        ]), 404);
+    }
+}
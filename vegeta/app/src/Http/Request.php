@@ -0,0 +1,16 @@
+<?php
+
+namespace Bench\Http;
+
+final class Request
+{
+    public array $attributes = [];
+
+    public function __construct(
+        public readonly string $method,
+        public readonly string $path,
+        public readonly array $query = [],
+        public readonly array $cookies = [],
+    ) {
+    }
+}
@@ -0,0 +1,25 @@
+<?php
+
+namespace Bench\Routing;
+
+final class Route
+{
+    private readonly string $regex;
+
+    public function __construct(
+        public readonly string $method,
+        string $pattern,
+        public readonly array $handler,
+    ) {
+        $this->regex = '#^' . preg_replace('#\{(\w+)\}#', '(?P<$1>[^/]+)', $pattern) . '$#';
+    }
+
+    /** Named parameters of the path, or null when the route does not match */
+    public function match(string $method, string $path): ?array
+    {
+        if ($method !== $this->method || !preg_match($this->regex, $path, $matches)) {
+            return null;
+        }
+        return array_filter($matches, 'is_string', ARRAY_FILTER_USE_KEY);
+    }
+}
@@ -0,0 +1,28 @@
+<?php
+
+namespace Bench\Routing;
+
+use Bench\Http\Request;
+
+final class Router
+{
+    /** @var Route[] */
+    private array $routes = [];
+
+    public function get(string $pattern, array $handler): void
+    {
+        $this->routes[] = new Route('GET', $pattern, $handler);
+    }
+
+    /** [Route, parameters] of the first matching route, or null */
+    public function match(Request $request): ?array
+    {
+        foreach ($this->routes as $route) {
+            $params = $route->match($request->method, $request->path);
+            if ($params !== null) {
+                return [$route, $params];
+            }
+        }
+        return null;
+    }
+}
@@ -0,0 +1,6 @@
+<h1><?= $this->e($title) ?></h1>
+<div class="grid">
+<?php foreach ($products as $product): ?>
+<?= $this->partial('partials/product_card', ['product' => $product]) ?>
+<?php endforeach ?>
+</div>
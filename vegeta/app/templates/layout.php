@@ -0,0 +1,25 @@
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title><?= $this->e($title) ?> - Bench Shop</title>
+</head>
+<body>
+    <header>
+        <a class="logo" href="/">Bench Shop</a>
+        <nav>
+            <ul>
+<?php foreach ($categories as $category): ?>
+                <li><a href="/categories/<?= $this->e($category['slug']) ?>"><?= $this->e($category['name']) ?></a></li>
+<?php endforeach ?>
+            </ul>
+        </nav>
+    </header>
+    <main>
+<?= $content ?>
+    </main>
+    <footer>
+        <p>&copy; Bench Shop</p>
+    </footer>
+</body>
+</html>
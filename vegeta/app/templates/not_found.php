@@ -0,0 +1,2 @@
+<h1>Not found</h1>
+<p>The page you are looking for does not exist.</p>
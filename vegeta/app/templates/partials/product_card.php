@@ -0,0 +1,7 @@
+    <div class="card">
+        <a href="/products/<?= (int) $product['id'] ?>"><?= $this->e($product['name']) ?></a>
+        <span class="price"><?= $this->money($product['price_cents']) ?></span>
+<?php if ($product['stock'] <= 0): ?>
+        <span class="badge">Out of stock</span>
+<?php endif ?>
+    </div>
@@ -0,0 +1,5 @@
+    <div class="review">
+        <p class="stars"><?= str_repeat('&#9733;', (int) $review['rating']) . str_repeat('&#9734;', 5 - (int) $review['rating']) ?></p>
+        <p class="author"><?= $this->e($review['author']) ?>, <?= $this->e(date('F j, Y', strtotime($review['created_at']))) ?></p>
+        <p><?= $this->e($review['body']) ?></p>
+    </div>
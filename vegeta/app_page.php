@@ -0,0 +1,13 @@
+<?php
+
+// Framework-style HTML page: autoloading, routing, SQLite queries, templates
+// and a file-backed session from a fixed pool of clients.
+
+use Bench\Http\Request;
+
+$kernel = require __DIR__ . '/app/bootstrap.php';
+
+$path = $_GET['path'] ?? '/products/' . mt_rand(1, $kernel->config['products']);
+$session = 'bench' . mt_rand(1, $kernel->config['session_pool']);
+
+$kernel->handle(new Request('GET', $path, $_GET, ['session' => $session]))->send();
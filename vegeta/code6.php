@@ -0,0 +1,5 @@
+<?php
+
+usleep(50000);
+
+echo "OK\n";
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+
+import http.client
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import analysis
+
+RUNS = int(os.environ.get('COLDSTART_RUNS', 5))
+FIRST_REQUESTS = int(os.environ.get('COLDSTART_REQUESTS', 100))
+STEADY_TIME = int(os.environ.get('COLDSTART_STEADY_TIME', 5))
+CONNECTIONS = int(os.environ.get('WRK_CONNECTIONS', 20))
+
+# Give up on a start after this many seconds
+READY_TIMEOUT = 30
+# Throughput windows used to detect steady state
+WINDOW_NS = 100_000_000
+STEADY_FRACTION = 0.9
+STEADY_WINDOWS = 5
+
+def request(conn, path):
+    """Send one GET over conn and return the status code"""
+    conn.request('GET', path)
+    response = conn.getresponse()
+    response.read()
+    return response.status
+
+def wait_first_response(path, t0):
+    """Poll path until it returns 200, return ms since t0 (None on timeout)"""
+    deadline = t0 + READY_TIMEOUT * 1_000_000_000
+    while time.perf_counter_ns() < deadline:
+        conn = http.client.HTTPConnection('localhost', 80, timeout=READY_TIMEOUT)
+        try:
+            if request(conn, path) == 200:
+                return (time.perf_counter_ns() - t0) / 1_000_000
+        except (OSError, http.client.HTTPException):
+            pass
+        finally:
+            conn.close()
+        time.sleep(0.001)
+    return None
+
+def first_latencies(path):
+    """Latency in ms of the first FIRST_REQUESTS sequential keep-alive requests"""
+    conn = http.client.HTTPConnection('localhost', 80, timeout=READY_TIMEOUT)
+    latencies = []
+    try:
+        for _ in range(FIRST_REQUESTS):
+            start = time.perf_counter_ns()
+            request(conn, path)
+            latencies.append(round((time.perf_counter_ns() - start) / 1_000_000, 3))
+    finally:
+        conn.close()
+    return latencies
+
+def time_to_steady(counts):
+    """Seconds until throughput stays within STEADY_FRACTION of its final level
+
+    The steady level is the median window of the second half of the attack.
+    Throughput is smoothed over STEADY_WINDOWS consecutive windows; steady
+    state starts after the last point where that average falls below
+    STEADY_FRACTION of the steady level.
+    """
+    # The last window is usually partial
+    counts = counts[:-1]
+    if len(counts) < 2 * STEADY_WINDOWS:
+        return None, None
+
+    steady = statistics.median(counts[len(counts) // 2:])
+    steady_rps = round(steady * 1_000_000_000 / WINDOW_NS, 2)
+    averages = [sum(counts[i:i + STEADY_WINDOWS]) / STEADY_WINDOWS for i in range(len(counts) - STEADY_WINDOWS + 1)]
+    below = [i for i, average in enumerate(averages) if average < STEADY_FRACTION * steady]
+    start = below[-1] + 1 if below else 0
+    if start == len(averages):
+        return None, steady_rps
+    return round(start * WINDOW_NS / 1_000_000_000, 2), steady_rps
+
+def measure(script, out_dir, bench_name, run):
+    """Fresh start of the server, measured against a single script"""
+    path = f'/{script}'
+    subprocess.run(['bench-server', 'stop'], check=True)
+
+    t0 = time.perf_counter_ns()
+    subprocess.run(['bench-server', 'launch'], check=True)
+    ttfr = wait_first_response(path, t0)
+    if ttfr is None:
+        print(f"  {script}: no successful response within {READY_TIMEOUT}s")
+        return None
+
+    latencies = first_latencies(path)
+
+    # Steady state is reported from launch, including the first requests
+    load_start = (time.perf_counter_ns() - t0) / 1_000_000_000
+    vegeta_bin = out_dir / f"{Path(script).stem}-{bench_name}-run{run}.bin"
+    with open(vegeta_bin, 'wb') as f:
+        subprocess.run(
+            ['vegeta', 'attack', f'-duration={STEADY_TIME}s', '-rate=0', f'-max-workers={CONNECTIONS}'],
+            input=f'GET http://localhost:80{path}\n'.encode(),
+            stdout=f,
+            check=True
+        )
+    counts = analysis.window_counts(analysis.load(vegeta_bin)['timestamp'], WINDOW_NS)
+    steady_after, steady_rps = time_to_steady(counts.tolist())
+    if steady_after is not None:
+        steady_after = round(load_start + steady_after, 2)
+
+    print(
+        f"  {script}: first response {ttfr:.1f} ms, "
+        f"first request {latencies[0]:.2f} ms, "
+        f"p50 of first {FIRST_REQUESTS} {statistics.median(latencies):.2f} ms, "
+        f"load test from {load_start:.2f}s, steady after {steady_after}s at {steady_rps} req/s"
+    )
+
+    return {
+        'script': script,
+        'run': run,
+        'ttfr_ms': round(ttfr, 3),
+        'first_latencies_ms': latencies,
+        'load_start_s': round(load_start, 3),
+        'steady_rps': steady_rps,
+        'time_to_steady_s': steady_after
+    }
+
+def main():
+    if len(sys.argv) < 3:
+        print("Usage: coldstart.py <bench_name> <script1> [script2] ...")
+        sys.exit(1)
+
+    bench_name = sys.argv[1]
+    scripts = [Path(s).name for s in sys.argv[2:]]
+
+    out_dir = Path('/app/vegeta/coldstart')
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    results = []
+    for run in range(1, RUNS + 1):
+        print(f"--- cold start run {run}/{RUNS} ---")
+        for script in scripts:
+            result = measure(script, out_dir, bench_name, run)
+            if result:
+                results.append(result)
+
+    subprocess.run(['bench-server', 'stop'], check=True)
+
+    output_file = out_dir / f"coldstart-{bench_name}.json"
+    output_file.write_text(json.dumps({
+        'server': bench_name,
+        'runs': RUNS,
+        'first_requests': FIRST_REQUESTS,
+        'steady_time_s': STEADY_TIME,
+        'results': results
+    }, indent=2))
+    output_file.chmod(0o666)
+    print(f"Cold start results: {output_file}")
+
+if __name__ == '__main__':
+    main()
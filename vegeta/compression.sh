@@ -0,0 +1,68 @@
+#!/bin/bash
+# Compression and static-asset suite.
+#
+# Attacks the compression listener (port 8081) with every PHP script and every
+# static asset from /srv/static, once per Accept-Encoding, and records the CPU
+# time consumed by the server processes (SERVER_PROCS) during each attack.
+# Summarize the results with generate-compression.py.
+set -e
+
+ENCODINGS=${BENCH_ENCODINGS:-"identity gzip zstd br"}
+OUT_DIR=/app/vegeta/compression
+CLK_TCK=$(getconf CLK_TCK)
+
+# Sum of user+system clock ticks of all processes named in SERVER_PROCS
+server_cpu_ticks() {
+    cat /proc/[0-9]*/stat 2>/dev/null | awk -v procs=" ${SERVER_PROCS} " '
+        { name = substr($2, 2, length($2) - 2) }
+        index(procs, " " name " ") { ticks += $14 + $15 }
+        END { print ticks + 0 }
+    '
+}
+
+mkdir -p "$OUT_DIR"
+
+TARGETS=""
+for script in /app/*.php; do
+    TARGETS="$TARGETS $(basename "$script")"
+done
+for asset in /srv/static/*; do
+    TARGETS="$TARGETS static/$(basename "$asset")"
+done
+
+echo "=== compression ==="
+echo ""
+
+for target in $TARGETS; do
+    name=${target//\//_}
+
+    for encoding in $ENCODINGS; do
+        # Record what the server actually negotiated (small or non-text
+        # responses are sent uncompressed, some encoders are not available)
+        negotiated=$(curl -s -o /dev/null -D - -H "Accept-Encoding: ${encoding}" "http://localhost:8081/${target}" \
+            | tr -d '\r' | awk -F': *' 'tolower($1) == "content-encoding" { print $2 }')
+        negotiated=${negotiated:-identity}
+
+        echo "--- ${target} (${encoding}, negotiated ${negotiated}) ---"
+
+        bin="${OUT_DIR}/${name}-${encoding}-${BENCH_NAME}.bin"
+        cpu_before=$(server_cpu_ticks)
+        printf 'GET http://localhost:8081/%s\nAccept-Encoding: %s\n' "$target" "$encoding" \
+            | vegeta attack -duration=${WRK_TIME}s -rate=0 -max-workers=${WRK_CONNECTIONS} > "$bin"
+        cpu_after=$(server_cpu_ticks)
+        vegeta report "$bin"
+
+        cpu_seconds=$(awk -v ticks=$((cpu_after - cpu_before)) -v hz="$CLK_TCK" 'BEGIN { printf "%.3f", ticks / hz }')
+        cat > "${bin%.bin}.json" <<JSON
+{
+  "target": "${target}",
+  "encoding": "${encoding}",
+  "negotiated": "${negotiated}",
+  "server": "${BENCH_NAME}",
+  "cpu_seconds": ${cpu_seconds}
+}
+JSON
+        echo "Server CPU: ${cpu_seconds}s"
+        echo ""
+    done
+done
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Run one vegeta attack from several load generators and merge the results.
+
+Drop-in for `vegeta attack`: targets are read from stdin, the merged results
+are written to stdout as a single vegeta binary file, so `vegeta report` and
+the dashboards work unchanged.
+
+    echo "GET http://localhost/code4.php" | \\
+        python3 coordinator.py --clients 4 -- -duration=15s -rate=0 -max-workers=100 > code4.bin
+
+Each client gets an equal share of -rate, -max-workers and -workers. Clients
+are local processes, or containers sharing a network namespace with the server
+when --docker-image is set. All of them wait for a common start time before
+attacking; `vegeta encode` merges their result files. The merged file
+interleaves the clients' results rather than sorting them by timestamp, which
+none of the reports depend on.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Attack flags shared out between the clients
+SPLIT_FLAGS = ('rate', 'max-workers', 'workers')
+
+def log(message):
+    print(message, file=sys.stderr)
+
+def split(total, clients):
+    """Integer shares of total, differing by at most one"""
+    base, rest = divmod(total, clients)
+    return [base + (i < rest) for i in range(clients)]
+
+def parse_attack_args(args):
+    """Split vegeta attack args into the values to share out and the rest"""
+    values = {}
+    rest = []
+    args = list(args)
+    while args:
+        arg = args.pop(0)
+        name, has_value, value = arg.lstrip('-').partition('=')
+        if not arg.startswith('-') or name not in SPLIT_FLAGS:
+            rest.append(arg)
+            continue
+        if not has_value:
+            value = args.pop(0)
+        values[name] = value
+    return values, rest
+
+def client_args(values, rest, clients):
+    """vegeta attack args for every client"""
+    shares = [list(rest) for _ in range(clients)]
+    for name, value in values.items():
+        # -rate may be given as freq/duration
+        freq, slash, per = value.partition('/')
+        total = int(freq)
+        if name == 'rate' and total == 0:
+            parts = [0] * clients
+        elif total < clients:
+            raise SystemExit(f"Error: -{name}={value} cannot be split between {clients} clients")
+        else:
+            parts = split(total, clients)
+        for args, part in zip(shares, parts):
+            args.append(f'-{name}={part}{slash}{per}')
+    for i, args in enumerate(shares, 1):
+        args.append(f'-name=client{i}')
+    return shares
+
+def client_command(args, start_at, docker_image, docker_network, docker_args):
+    """Command line of one client, waiting for start_at before attacking"""
+    worker = ['worker', f'--start-at={start_at}', '--', 'vegeta', 'attack', *args]
+    if not docker_image:
+        return [sys.executable, os.path.abspath(__file__), *worker]
+
+    script_dir = Path(__file__).resolve().parent
+    return [
+        'docker', 'run', '--rm', '-i',
+        f'--network={docker_network}',
+        '-v', f'{script_dir}:/coordinator:ro',
+        *docker_args,
+        docker_image,
+        'python3', f'/coordinator/{Path(__file__).name}', *worker
+    ]
+
+def worker(start_at, command):
+    """Sleep until start_at (unix ns), then become the attack process"""
+    delay = (start_at - time.time_ns()) / 1_000_000_000
+    if delay > 0:
+        time.sleep(delay)
+    else:
+        log(f"Warning: client started {-delay * 1000:.0f} ms after the common start time")
+    os.execvp(command[0], command)
+
+def merge(vegeta_bins, out):
+    """Merge the clients' results into one vegeta binary stream"""
+    subprocess.run(
+        ['vegeta', 'encode', '--to', 'gob', *map(str, vegeta_bins)],
+        stdout=out,
+        check=True
+    )
+
+def summarize(vegeta_bin, name):
+    """One line per client to spot a client that could not keep up"""
+    result = subprocess.run(
+        ['vegeta', 'report', '-type=json', str(vegeta_bin)],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    report = json.loads(result.stdout)
+    log(
+        f"  {name}: {report['requests']} requests, {report['rate']:,.2f} req/s sent, "
+        f"{report['throughput']:,.2f} req/s ok, p99 {report['latencies']['99th'] / 1_000_000:.2f} ms"
+    )
+    return report['requests']
+
+def run(args):
+    values, rest = parse_attack_args(args.attack_args)
+    shares = client_args(values, rest, args.clients)
+
+    lead = args.lead if args.lead is not None else (5 if args.docker_image else 1)
+    start_at = time.time_ns() + int(lead * 1_000_000_000)
+    log(f"Starting {args.clients} clients in {lead}s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Every client reads the full target list
+        targets = Path(tmp) / 'targets.txt'
+        targets.write_bytes(sys.stdin.buffer.read())
+
+        procs = []
+        for i, attack_args in enumerate(shares, 1):
+            vegeta_bin = Path(tmp) / f'client{i}.bin'
+            with open(targets, 'rb') as stdin, open(vegeta_bin, 'wb') as out:
+                proc = subprocess.Popen(
+                    client_command(attack_args, start_at, args.docker_image, args.docker_network, args.docker_arg),
+                    stdin=stdin,
+                    stdout=out
+                )
+            procs.append((proc, vegeta_bin))
+
+        failed = [i for i, (proc, _) in enumerate(procs, 1) if proc.wait() != 0]
+        if failed:
+            log(f"Error: client(s) {', '.join(map(str, failed))} failed")
+            sys.exit(1)
+
+        vegeta_bins = [vegeta_bin for _, vegeta_bin in procs]
+        count = sum(summarize(vegeta_bin, f'client{i}') for i, vegeta_bin in enumerate(vegeta_bins, 1))
+
+        merge(vegeta_bins, sys.stdout.buffer)
+        log(f"Merged {count} results from {args.clients} clients")
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == 'worker':
+        parser = argparse.ArgumentParser(prog='coordinator.py worker')
+        parser.add_argument('--start-at', type=int, required=True, help='Common start time (unix ns)')
+        parser.add_argument('command', nargs=argparse.REMAINDER)
+        args = parser.parse_args(sys.argv[2:])
+        worker(args.start_at, args.command[1:] if args.command[:1] == ['--'] else args.command)
+
+    parser = argparse.ArgumentParser(description='Run a vegeta attack from several clients and merge the results')
+    parser.add_argument('--clients', type=int, default=os.cpu_count(), help='Number of load generators')
+    parser.add_argument('--lead', type=float, help='Seconds until the common start (default 1, 5 with --docker-image)')
+    parser.add_argument('--docker-image', help='Run each client in a container of this image (needs vegeta and python3)')
+    parser.add_argument('--docker-network', default='host', help='Network for client containers, e.g. container:<server>')
+    parser.add_argument('--docker-arg', action='append', default=[], help='Extra docker run argument, e.g. --docker-arg=--cpus=2')
+    parser.add_argument('attack_args', nargs=argparse.REMAINDER, help='vegeta attack flags after --')
+    args = parser.parse_args()
+
+    if args.attack_args[:1] == ['--']:
+        args.attack_args = args.attack_args[1:]
+    if args.clients < 1:
+        parser.error('--clients must be at least 1')
+    if args.docker_image and not shutil.which('docker'):
+        parser.error('--docker-image needs the docker CLI')
+
+    run(args)
+
+if __name__ == '__main__':
+    main()
@@ -1,29 +1,93 @@
 #!/usr/bin/env python3
 
-import json
-import subprocess
 import sys
 from pathlib import Path
 from collections import defaultdict
 
+import numpy as np
+
+import analysis
+
 def get_metrics(vegeta_bin):
     """Extract metrics from vegeta binary file"""
-    result = subprocess.run(
-        ['vegeta', 'report', '-type=json', vegeta_bin],
-        capture_output=True,
-        text=True
-    )
-    report = json.loads(result.stdout)
-
-    return {
-        'latency_mean': round(report['latencies']['mean'] / 1_000_000, 2),
-        'latency_50': round(report['latencies']['50th'] / 1_000_000, 2),
-        'latency_99': round(report['latencies']['99th'] / 1_000_000, 2),
-        'latency_max': round(report['latencies']['max'] / 1_000_000, 2),
-        'rps': round(report['rate'], 2),
-        'success': round(report['success'] * 100),
-        'total_requests': report['requests']
-    }
+    return analysis.summary(analysis.load(vegeta_bin))
+
+PROTOCOLS = ['h1-close', 'h1', 'h1-tls', 'h2', 'h2c', 'h3']
+
+def protocol_sort_key(protocol):
+    """Order protocols as in the benchmark matrix, unknown ones last"""
+    if protocol in PROTOCOLS:
+        return (PROTOCOLS.index(protocol), protocol)
+    return (len(PROTOCOLS), protocol)
+
+# Table rows: label, metric, value format and whether lower is better
+METRICS = [
+    ('Requests/sec', 'rps', '{:,.2f}', False),
+    ('Mean Latency', 'latency_mean', '{:.2f} ms', True),
+    ('50th Percentile', 'latency_50', '{:.2f} ms', True),
+    ('99th Percentile', 'latency_99', '{:.2f} ms', True),
+]
+
+def build_rows(data, all_servers):
+    """Build the table rows for every test of one protocol"""
+    html = ''
+
+    for test in sorted(data.keys()):
+        test_data = data[test]
+
+        # Baseline is the first server that has data for this test
+        servers = [server for server in all_servers if server in test_data]
+        if not servers:
+            continue
+        baseline_server = servers[0]
+
+        # servers x metrics, compared with the baseline row at once
+        values = np.array([[test_data[server][key] for _, key, _, _ in METRICS] for server in servers])
+        pct = dict(zip(servers, analysis.deltas(values, values[0])))
+        success = np.array([test_data[server]['success'] for server in servers])
+        success_diff = dict(zip(servers, success - success[0]))
+
+        # Test header row
+        html += f'''                <tr class="test-header">
+                    <td colspan="{len(all_servers) + 1}">{test}.php</td>
+                </tr>
+'''
+
+        for col, (label, key, fmt, lower_is_better) in enumerate(METRICS):
+            html += f'                <tr>\n                    <td class="metric-label">{label}</td>\n'
+            for server in all_servers:
+                if server not in test_data:
+                    html += '                    <td>-</td>\n'
+                    continue
+                value = fmt.format(test_data[server][key])
+                delta = pct[server][col]
+                if server == baseline_server:
+                    html += f'                    <td class="baseline value">{value}</td>\n'
+                elif np.isnan(delta):
+                    html += f'                    <td class="value">{value}</td>\n'
+                else:
+                    pct_class = 'negative' if (delta > 0) == lower_is_better else 'positive'
+                    html += f'                    <td class="value">{value} <span class="{pct_class}">({delta:+.1f}%)</span></td>\n'
+            html += '                </tr>\n'
+
+        # Success Rate row
+        html += '                <tr>\n                    <td class="metric-label">Success Rate</td>\n'
+        for server in all_servers:
+            if server not in test_data:
+                html += '                    <td>-</td>\n'
+                continue
+            value = test_data[server]['success']
+            diff = success_diff[server]
+            if server == baseline_server:
+                html += f'                    <td class="baseline value">{value}%</td>\n'
+            elif diff == 0:
+                html += f'                    <td class="value">{value}%</td>\n'
+            else:
+                pct_class = 'positive' if diff > 0 else 'negative'
+                html += f'                    <td class="value">{value}% <span class="{pct_class}">({diff:+.0f}pp)</span></td>\n'
+        html += '                </tr>\n'
+
+    return html
 
 def main():
     vegeta_dir = Path('vegeta')
@@ -31,25 +95,39 @@ def main():
         print("Error: vegeta directory not found")
         sys.exit(1)
 
-    # Organize data by test and server
-    data = defaultdict(dict)
+    # Organize data by protocol, test and server
+    data = defaultdict(lambda: defaultdict(dict))
+
+    # Results written before the protocol matrix live directly in vegeta/,
+    # other subdirectories belong to the optional suites
+    bin_files = [('h1', bin_file) for bin_file in vegeta_dir.glob('*.bin')]
+    for protocol in PROTOCOLS:
+        bin_files += [(protocol, bin_file) for bin_file in (vegeta_dir / protocol).glob('*.bin')]
 
-    for bin_file in vegeta_dir.glob('*.bin'):
-        # Parse filename: code1-nginx.bin -> test=code1, server=nginx
+    for protocol, bin_file in bin_files:
+        # Parse path: h2/code1-nginx.bin -> protocol=h2, test=code1, server=nginx
         parts = bin_file.stem.split('-')
         if len(parts) >= 2:
             test = parts[0]
             server = '-'.join(parts[1:])
 
-            print(f"Processing {test} - {server}...")
-            data[test][server] = get_metrics(str(bin_file))
+            print(f"Processing {test} - {server} ({protocol})...")
+            metrics = get_metrics(str(bin_file))
+            if metrics:
+                data[protocol][test][server] = metrics
 
     if not data:
         print("Error: No benchmark data found")
         sys.exit(1)
 
     # Get list of all servers (sorted for consistent order)
-    all_servers = sorted(set(server for test_data in data.values() for server in test_data.keys()))
+    all_servers = sorted(set(
+        server
+        for protocol_data in data.values()
+        for test_data in protocol_data.values()
+        for server in test_data.keys()
+    ))
+    protocols = sorted(data.keys(), key=protocol_sort_key)
 
     # Generate HTML
     html = '''<!DOCTYPE html>
@@ -79,124 +157,29 @@ def main():
             <h1>Benchmark Comparison - All Servers</h1>
             <p>First server listed for each test is used as baseline (100%). Percentages show relative performance.</p>
         </div>
+'''
 
+    for protocol in protocols:
+        html += f'''
+        <h2>{protocol}</h2>
         <table>
             <thead>
                 <tr>
                     <th>Test / Metric</th>
 '''
+        for server in all_servers:
+            html += f'                    <th>{server}</th>\n'
 
-    for server in all_servers:
-        html += f'                    <th>{server}</th>\n'
-
-    html += '''                </tr>
+        html += '''                </tr>
             </thead>
             <tbody>
 '''
-
-    # Generate rows for each test
-    for test in sorted(data.keys()):
-        test_data = data[test]
-
-        # Determine baseline (first server that has data for this test)
-        baseline_server = None
-        for server in all_servers:
-            if server in test_data:
-                baseline_server = server
-                break
-
-        if not baseline_server:
-            continue
-
-        baseline = test_data[baseline_server]
-
-        # Test header row
-        html += f'''                <tr class="test-header">
-                    <td colspan="{len(all_servers) + 1}">{test}.php</td>
-                </tr>
+        html += build_rows(data[protocol], all_servers)
+        html += '''            </tbody>
+        </table>
 '''
 
-        # RPS row
-        html += '                <tr>\n                    <td class="metric-label">Requests/sec</td>\n'
-        for server in all_servers:
-            if server in test_data:
-                rps = test_data[server]['rps']
-                if server == baseline_server:
-                    html += f'                    <td class="baseline value">{rps:,.2f}</td>\n'
-                else:
-                    pct = ((rps - baseline['rps']) / baseline['rps']) * 100
-                    pct_class = 'positive' if pct > 0 else 'negative'
-                    html += f'                    <td class="value">{rps:,.2f} <span class="{pct_class}">({pct:+.1f}%)</span></td>\n'
-            else:
-                html += '                    <td>-</td>\n'
-        html += '                </tr>\n'
-
-        # Mean Latency row
-        html += '                <tr>\n                    <td class="metric-label">Mean Latency</td>\n'
-        for server in all_servers:
-            if server in test_data:
-                lat = test_data[server]['latency_mean']
-                if server == baseline_server:
-                    html += f'                    <td class="baseline value">{lat:.2f} ms</td>\n'
-                else:
-                    pct = ((lat - baseline['latency_mean']) / baseline['latency_mean']) * 100
-                    pct_class = 'negative' if pct > 0 else 'positive'  # Lower is better
-                    html += f'                    <td class="value">{lat:.2f} ms <span class="{pct_class}">({pct:+.1f}%)</span></td>\n'
-            else:
-                html += '                    <td>-</td>\n'
-        html += '                </tr>\n'
-
-        # 50th Percentile row
-        html += '                <tr>\n                    <td class="metric-label">50th Percentile</td>\n'
-        for server in all_servers:
-            if server in test_data:
-                lat = test_data[server]['latency_50']
-                if server == baseline_server:
-                    html += f'                    <td class="baseline value">{lat:.2f} ms</td>\n'
-                else:
-                    pct = ((lat - baseline['latency_50']) / baseline['latency_50']) * 100
-                    pct_class = 'negative' if pct > 0 else 'positive'
-                    html += f'                    <td class="value">{lat:.2f} ms <span class="{pct_class}">({pct:+.1f}%)</span></td>\n'
-            else:
-                html += '                    <td>-</td>\n'
-        html += '                </tr>\n'
-
-        # 99th Percentile row
-        html += '                <tr>\n                    <td class="metric-label">99th Percentile</td>\n'
-        for server in all_servers:
-            if server in test_data:
-                lat = test_data[server]['latency_99']
-                if server == baseline_server:
-                    html += f'                    <td class="baseline value">{lat:.2f} ms</td>\n'
-                else:
-                    pct = ((lat - baseline['latency_99']) / baseline['latency_99']) * 100
-                    pct_class = 'negative' if pct > 0 else 'positive'
-                    html += f'                    <td class="value">{lat:.2f} ms <span class="{pct_class}">({pct:+.1f}%)</span></td>\n'
-            else:
-                html += '                    <td>-</td>\n'
-        html += '                </tr>\n'
-
-        # Success Rate row
-        html += '                <tr>\n                    <td class="metric-label">Success Rate</td>\n'
-        for server in all_servers:
-            if server in test_data:
-                success = test_data[server]['success']
-                if server == baseline_server:
-                    html += f'                    <td class="baseline value">{success}%</td>\n'
-                else:
-                    diff = success - baseline['success']
-                    if diff == 0:
-                        html += f'                    <td class="value">{success}%</td>\n'
-                    else:
-                        pct_class = 'positive' if diff > 0 else 'negative'
-                        html += f'                    <td class="value">{success}% <span class="{pct_class}">({diff:+.0f}pp)</span></td>\n'
-            else:
-                html += '                    <td>-</td>\n'
-        html += '                </tr>\n'
-
-    html += '''            </tbody>
-        </table>
-    </div>
+    html += '''    </div>
 </body>
 </html>'''
 
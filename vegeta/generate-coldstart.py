@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+
+import json
+import statistics
+import sys
+from pathlib import Path
+from collections import defaultdict
+
+import numpy as np
+
+import analysis
+
+def fmt_range(values, unit):
+    """Median with min-max range, or '-' when there are no values"""
+    values = [v for v in values if v is not None]
+    if not values:
+        return '-'
+    return f'{statistics.median(values):,.2f} {unit} <span class="range">({min(values):,.2f} - {max(values):,.2f})</span>'
+
+def summarize(results):
+    """Aggregate the repeated cold starts of one script on one server"""
+    first = [latency for r in results for latency in r['first_latencies_ms']]
+    by_index = list(zip(*(r['first_latencies_ms'] for r in results)))
+    p50, p99 = (float(v) for v in analysis.percentiles(np.array(first), [50, 99]))
+
+    return {
+        'ttfr': [r['ttfr_ms'] for r in results],
+        'first_request': [r['first_latencies_ms'][0] for r in results],
+        'first_p50': p50,
+        'first_p99': p99,
+        'load_start': [r.get('load_start_s') for r in results],
+        'time_to_steady': [r['time_to_steady_s'] for r in results],
+        'steady_rps': [r['steady_rps'] for r in results],
+        'median_by_index': [round(statistics.median(latencies), 3) for latencies in by_index]
+    }
+
+def main():
+    coldstart_dir = Path('vegeta') / 'coldstart'
+    if not coldstart_dir.exists():
+        print("Error: vegeta/coldstart directory not found")
+        sys.exit(1)
+
+    # Organize data by script and server
+    data = defaultdict(dict)
+
+    for json_file in sorted(coldstart_dir.glob('coldstart-*.json')):
+        report = json.loads(json_file.read_text())
+        server = report['server']
+
+        by_script = defaultdict(list)
+        for result in report['results']:
+            by_script[result['script']].append(result)
+
+        for script, results in by_script.items():
+            print(f"Processing {script} - {server} ({len(results)} starts)...")
+            data[script][server] = summarize(results)
+
+    if not data:
+        print("Error: No cold start data found")
+        sys.exit(1)
+
+    all_servers = sorted(set(server for script_data in data.values() for server in script_data.keys()))
+
+    html = '''<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Cold Start Benchmark - All Servers</title>
+    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }
+        .container { max-width: 1600px; margin: 0 auto; }
+        .header { background: #2c3e50; color: white; padding: 20px; border-radius: 5px; margin-bottom: 20px; }
+        table { width: 100%; background: white; border-collapse: collapse; margin-bottom: 30px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ecf0f1; }
+        th { background: #2c3e50; color: white; font-weight: 600; position: sticky; top: 0; }
+        tr:hover { background: #f8f9fa; }
+        .test-header { background: #34495e; color: white; font-weight: bold; font-size: 1.1em; }
+        .metric-label { font-weight: 600; color: #555; background: #ecf0f1; }
+        .value { font-family: 'Courier New', monospace; }
+        .range { color: #999; font-size: 0.9em; }
+        .chart-container { background: white; padding: 20px; border-radius: 5px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); margin-bottom: 20px; }
+        canvas { max-height: 400px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Cold Start Benchmark - All Servers</h1>
+            <p>Medians over repeated fresh starts, min - max in parentheses. Time to first response, load test
+            start and time to steady state are all measured from launching the server.</p>
+        </div>
+
+        <table>
+            <thead>
+                <tr>
+                    <th>Script / Metric</th>
+'''
+
+    for server in all_servers:
+        html += f'                    <th>{server}</th>\n'
+
+    html += '''                </tr>
+            </thead>
+            <tbody>
+'''
+
+    rows = [
+        ('Time to first response', lambda s: fmt_range(s['ttfr'], 'ms')),
+        ('First request latency', lambda s: fmt_range(s['first_request'], 'ms')),
+        ('50th Percentile (first requests)', lambda s: f"{s['first_p50']:,.2f} ms"),
+        ('99th Percentile (first requests)', lambda s: f"{s['first_p99']:,.2f} ms"),
+        ('Load test start', lambda s: fmt_range(s['load_start'], 's')),
+        ('Time to steady state', lambda s: fmt_range(s['time_to_steady'], 's')),
+        ('Steady Requests/sec', lambda s: fmt_range(s['steady_rps'], '')),
+    ]
+
+    for script in sorted(data.keys()):
+        html += f'''                <tr class="test-header">
+                    <td colspan="{len(all_servers) + 1}">{script}</td>
+                </tr>
+'''
+        for label, fmt in rows:
+            html += f'                <tr>\n                    <td class="metric-label">{label}</td>\n'
+            for server in all_servers:
+                if server in data[script]:
+                    html += f'                    <td class="value">{fmt(data[script][server])}</td>\n'
+                else:
+                    html += '                    <td>-</td>\n'
+            html += '                </tr>\n'
+
+    html += '''            </tbody>
+        </table>
+'''
+
+    charts = {
+        script: {server: summary['median_by_index'] for server, summary in script_data.items()}
+        for script, script_data in data.items()
+    }
+    for idx, script in enumerate(sorted(charts.keys())):
+        html += f'''
+        <div class="chart-container">
+            <h3>{script} - latency of the first requests after start (median over starts)</h3>
+            <canvas id="chart{idx}"></canvas>
+        </div>
+'''
+
+    html += '''    </div>
+
+    <script>
+        const charts = ''' + json.dumps(charts) + ''';
+        const scripts = ''' + json.dumps(sorted(charts.keys())) + ''';
+        const colors = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6', '#1abc9c'];
+
+        scripts.forEach((script, idx) => {
+            const servers = Object.keys(charts[script]).sort();
+            new Chart(document.getElementById('chart' + idx), {
+                type: 'line',
+                data: {
+                    datasets: servers.map((server, i) => ({
+                        label: server,
+                        data: charts[script][server].map((y, x) => ({ x: x + 1, y: y })),
+                        borderColor: colors[i % colors.length],
+                        borderWidth: 2,
+                        pointRadius: 0
+                    }))
+                },
+                options: {
+                    responsive: true,
+                    maintainAspectRatio: true,
+                    scales: {
+                        y: { type: 'logarithmic', title: { display: true, text: 'Latency (ms)' } },
+                        x: { type: 'linear', title: { display: true, text: 'Request number' } }
+                    }
+                }
+            });
+        });
+    </script>
+</body>
+</html>'''
+
+    output_file = 'coldstart-table.html'
+    with open(output_file, 'w') as f:
+        f.write(html)
+
+    Path(output_file).chmod(0o666)
+    print(f"\nGenerated {output_file}")
+
+if __name__ == '__main__':
+    main()
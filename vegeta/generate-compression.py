@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from collections import defaultdict
+
+ENCODINGS = ['identity', 'gzip', 'zstd', 'br']
+
+def get_metrics(vegeta_bin):
+    """Extract throughput, CPU and transfer metrics for one compression run"""
+    result = subprocess.run(
+        ['vegeta', 'report', '-type=json', str(vegeta_bin)],
+        capture_output=True,
+        text=True
+    )
+    report = json.loads(result.stdout)
+    sidecar = json.loads(vegeta_bin.with_suffix('.json').read_text())
+
+    requests = report['requests']
+    cpu_seconds = sidecar['cpu_seconds']
+
+    return {
+        'negotiated': sidecar['negotiated'],
+        'rps': round(report['rate'], 2),
+        'latency_99': round(report['latencies']['99th'] / 1_000_000, 2),
+        'cpu_us_per_request': round(cpu_seconds * 1_000_000 / requests, 1) if requests else 0,
+        'bytes_per_request': report['bytes_in']['mean'],
+        'mb_per_sec': round(report['bytes_in']['mean'] * report['rate'] / 1_000_000, 2),
+        'success': round(report['success'] * 100)
+    }
+
+def encoding_sort_key(encoding):
+    if encoding in ENCODINGS:
+        return (ENCODINGS.index(encoding), encoding)
+    return (len(ENCODINGS), encoding)
+
+def main():
+    compression_dir = Path('vegeta') / 'compression'
+    if not compression_dir.exists():
+        print("Error: vegeta/compression directory not found")
+        sys.exit(1)
+
+    # Organize data by target, encoding and server
+    data = defaultdict(lambda: defaultdict(dict))
+
+    for bin_file in sorted(compression_dir.glob('*.bin')):
+        # Parse filename: static_1k.html-gzip-nginx.bin -> target, encoding, server
+        parts = bin_file.stem.split('-')
+        if len(parts) >= 3 and bin_file.with_suffix('.json').exists():
+            target = parts[0].replace('_', '/', 1) if parts[0].startswith('static_') else parts[0]
+            encoding = parts[1]
+            server = '-'.join(parts[2:])
+
+            print(f"Processing {target} - {encoding} - {server}...")
+            data[target][encoding][server] = get_metrics(bin_file)
+
+    if not data:
+        print("Error: No compression data found")
+        sys.exit(1)
+
+    all_servers = sorted(set(
+        server
+        for target_data in data.values()
+        for encoding_data in target_data.values()
+        for server in encoding_data.keys()
+    ))
+
+    html = '''<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Compression Benchmark - All Servers</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }
+        .container { max-width: 1600px; margin: 0 auto; }
+        .header { background: #2c3e50; color: white; padding: 20px; border-radius: 5px; margin-bottom: 20px; }
+        table { width: 100%; background: white; border-collapse: collapse; margin-bottom: 30px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ecf0f1; }
+        th { background: #2c3e50; color: white; font-weight: 600; position: sticky; top: 0; }
+        tr:hover { background: #f8f9fa; }
+        .test-header { background: #34495e; color: white; font-weight: bold; font-size: 1.1em; }
+        .metric-label { font-weight: 600; color: #555; background: #ecf0f1; }
+        .value { font-family: 'Courier New', monospace; }
+        .muted { color: #999; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Compression Benchmark - All Servers</h1>
+            <p>RPS, server CPU time per request, transferred (compressed) bytes per second and compression ratio
+            versus the identity run. Greyed cells: the server did not negotiate the requested encoding.</p>
+        </div>
+
+        <table>
+            <thead>
+                <tr>
+                    <th>Target / Encoding</th>
+'''
+
+    for server in all_servers:
+        html += f'                    <th>{server}</th>\n'
+
+    html += '''                </tr>
+            </thead>
+            <tbody>
+'''
+
+    for target in sorted(data.keys()):
+        target_data = data[target]
+
+        html += f'''                <tr class="test-header">
+                    <td colspan="{len(all_servers) + 1}">{target}</td>
+                </tr>
+'''
+
+        for encoding in sorted(target_data.keys(), key=encoding_sort_key):
+            html += f'                <tr>\n                    <td class="metric-label">{encoding}</td>\n'
+            for server in all_servers:
+                metrics = target_data[encoding].get(server)
+                if not metrics:
+                    html += '                    <td>-</td>\n'
+                    continue
+
+                identity = target_data.get('identity', {}).get(server)
+                ratio = ''
+                if identity and metrics['bytes_per_request']:
+                    ratio = f", {identity['bytes_per_request'] / metrics['bytes_per_request']:.2f}x"
+
+                css = 'value' if metrics['negotiated'] == encoding else 'value muted'
+                html += (
+                    f'                    <td class="{css}">{metrics["rps"]:,.2f} req/s<br>'
+                    f'{metrics["cpu_us_per_request"]:,.1f} µs CPU/req<br>'
+                    f'{metrics["mb_per_sec"]:,.2f} MB/s{ratio}<br>'
+                    f'p99 {metrics["latency_99"]:.2f} ms, {metrics["success"]}%</td>\n'
+                )
+            html += '                </tr>\n'
+
+    html += '''            </tbody>
+        </table>
+    </div>
+</body>
+</html>'''
+
+    output_file = 'compression-table.html'
+    with open(output_file, 'w') as f:
+        f.write(html)
+
+    Path(output_file).chmod(0o666)
+    print(f"\nGenerated {output_file}")
+
+if __name__ == '__main__':
+    main()
@@ -1,68 +1,112 @@
 #!/usr/bin/env python3
 
+import argparse
 import json
-import subprocess
 import sys
 from pathlib import Path
 
-def get_metrics(vegeta_bin):
-    """Extract metrics from vegeta binary file"""
-    # Get JSON report
-    result = subprocess.run(
-        ['vegeta', 'report', '-type=json', vegeta_bin],
-        capture_output=True,
-        text=True
-    )
-    report = json.loads(result.stdout)
-
-    # Extract metrics
-    metrics = {
-        'latency_mean': round(report['latencies']['mean'] / 1_000_000, 2),
-        'latency_50': round(report['latencies']['50th'] / 1_000_000, 2),
-        'latency_99': round(report['latencies']['99th'] / 1_000_000, 2),
-        'latency_max': round(report['latencies']['max'] / 1_000_000, 2),
-        'rps': round(report['rate'], 2),
-        'success': round(report['success'] * 100),
-        'total_requests': report['requests']
+import numpy as np
+
+import analysis
+import gotrace
+
+# Points per chart series, for a reasonable file size
+MAX_POINTS = 200
+WINDOW_NS = 100_000_000
+
+def go_runtime(results, go_trace):
+    """Go runtime events during one attack and how its latency outliers line up with GC"""
+    timestamps, latencies = results['timestamp'], results['latency']
+    start_ns = int(timestamps.min())
+    end_ns = int((timestamps + latencies).max())
+    gc = [e for e in go_trace['gc'] if e['end_ns'] >= start_ns and e['start_ns'] <= end_ns]
+    sched = [e for e in go_trace['sched'] if start_ns <= e['ts_ns'] <= end_ns]
+
+    runtime = {
+        'gc_cycles': len(gc),
+        'gc_time_pct': round(gotrace.gc_time_fraction(gc, start_ns, end_ns) * 100, 2),
+        'gc_pause_max': max((e['pause_ms'] for e in gc), default=0),
+        'gc_events': [{
+            't': (e['start_ns'] - start_ns) / 1_000_000_000,
+            'pause_ms': e['pause_ms'],
+            'heap_mb': e['heap_start_mb'],
+            'live_mb': e['heap_live_mb']
+        } for e in gc],
+        'sched_events': [{
+            't': (e['ts_ns'] - start_ns) / 1_000_000_000,
+            'runqueue': e['runqueue'],
+            'threads': e['threads']
+        } for e in sched]
     }
 
-    # Sample data (max 200 points per test for reasonable file size)
-    sample_rate = max(1, metrics['total_requests'] // 200)
-
+    # Share of the slowest requests that were in flight during a GC cycle
+    gc_starts = [e['start_ns'] for e in gc]
+    gc_ends = [e['end_ns'] for e in gc]
+    for label, pct in (('99', 99), ('999', 99.9)):
+        threshold = analysis.percentiles(latencies, [pct])[0]
+        outliers = latencies >= threshold
+        in_gc = analysis.in_intervals(timestamps[outliers], timestamps[outliers] + latencies[outliers], gc_starts, gc_ends)
+        runtime[f'outliers_{label}_in_gc'] = round(float(in_gc.mean()) * 100, 1)
+
+    print(f"  {len(gc)} GC cycles, {runtime['outliers_99_in_gc']}% of p99 outliers during GC")
+    return runtime
+
+def get_metrics(vegeta_bin, go_trace=None):
+    """Extract metrics and chart series from vegeta binary file"""
+    results = analysis.load(vegeta_bin)
+    metrics = analysis.summary(results)
+    if not metrics:
+        return None
+    timestamps, latencies = results['timestamp'], results['latency']
+    start_ns = timestamps.min()
+
+    # Latency of every sample_rate-th request by start time; vegeta writes
+    # results in completion order
+    sample_rate = max(1, metrics['total_requests'] // MAX_POINTS)
     print(f"  Total requests: {metrics['total_requests']}, sampling every {sample_rate} requests")
+    sampled = np.argsort(timestamps, kind='stable')[::sample_rate]
+    metrics['latency_series'] = [
+        {'x': round(float(t), 3), 'y': round(float(y), 3)}
+        for t, y in zip((timestamps[sampled] - start_ns) / 1_000_000_000, latencies[sampled] / 1_000_000)
+    ]
+
+    # Exact throughput over all requests in 100ms windows
+    rps = analysis.window_counts(timestamps, WINDOW_NS) * (1_000_000_000 / WINDOW_NS)
+    metrics['rps_series'] = [
+        {'x': round(i * WINDOW_NS / 1_000_000_000, 1), 'y': float(y)} for i, y in enumerate(rps)
+    ]
 
-    # Get sampled data
-    result = subprocess.run(
-        f"vegeta encode --to json < {vegeta_bin} | awk 'NR % {sample_rate} == 1'",
-        shell=True,
-        capture_output=True,
-        text=True
-    )
-
-    results = []
-    for line in result.stdout.strip().split('\n'):
-        if line:
-            results.append(json.loads(line))
-
-    print(f"  Sampled {len(results)} data points")
-    metrics['results'] = results
-    metrics['sample_rate'] = sample_rate
+    edges, counts = analysis.histogram(latencies)
+    metrics['histogram'] = {'edges': [round(float(e), 3) for e in edges], 'counts': counts.tolist()}
+
+    if go_trace:
+        metrics['go'] = go_runtime(results, go_trace)
     return metrics
 
 def main():
-    if len(sys.argv) < 3:
-        print("Usage: generate-dashboard.py <bench_name> <vegeta_bin1> [vegeta_bin2] ...")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description='Generate the dashboard of one benchmark run')
+    parser.add_argument('bench_name')
+    parser.add_argument('vegeta_bins', nargs='+')
+    parser.add_argument('--go-trace', help='Go runtime trace (GODEBUG=gctrace=1) to overlay')
+    args = parser.parse_args()
 
-    bench_name = sys.argv[1]
-    vegeta_bins = sys.argv[2:]
+    bench_name = args.bench_name
+    go_trace = gotrace.load(args.go_trace) if args.go_trace else None
 
     # Collect all metrics
     all_data = {}
-    for bin_path in vegeta_bins:
+    for bin_path in args.vegeta_bins:
         filename = Path(bin_path).stem
         print(f"Processing {filename}...")
-        all_data[filename] = get_metrics(bin_path)
+        metrics = get_metrics(bin_path, go_trace)
+        if not metrics:
+            print("  No results, skipping")
+            continue
+        all_data[filename] = metrics
+
+    if not all_data:
+        print("Error: No benchmark data found")
+        sys.exit(1)
 
     # Generate colors for each test
     colors = [
@@ -133,7 +177,23 @@ def main():
                     <span class="metric-label">Success Rate</span>
                     <span class="metric-value">{data['success']}%</span>
                 </div>
-            </div>
+'''
+        go = data.get('go')
+        if go:
+            html += f'''                <div class="metric-row">
+                    <span class="metric-label">GC Cycles / Time in GC</span>
+                    <span class="metric-value">{go['gc_cycles']} / {go['gc_time_pct']}%</span>
+                </div>
+                <div class="metric-row">
+                    <span class="metric-label">Max GC Pause (STW)</span>
+                    <span class="metric-value">{go['gc_pause_max']} ms</span>
+                </div>
+                <div class="metric-row">
+                    <span class="metric-label">p99 / p99.9 Outliers During GC</span>
+                    <span class="metric-value">{go['outliers_99_in_gc']}% / {go['outliers_999_in_gc']}%</span>
+                </div>
+'''
+        html += '''            </div>
 '''
 
     html += '''
@@ -156,7 +216,18 @@ def main():
                 <h3>Throughput Over Time (100ms windows)</h3>
                 <canvas id="rpsTimeChart"></canvas>
             </div>
-        </div>
+            <div class="chart-container">
+                <h3>Latency Distribution</h3>
+                <canvas id="latencyHistogramChart"></canvas>
+            </div>
+'''
+    if go_trace:
+        html += '''            <div class="chart-container">
+                <h3>Go Scheduler Run Queue</h3>
+                <canvas id="schedTimeChart"></canvas>
+            </div>
+'''
+    html += '''        </div>
     </div>
 
     <script>
@@ -218,10 +289,9 @@ def main():
 
         // Latency Over Time
         const latencyDatasets = filenames.map((filename, idx) => {
-            const results = data[filename].results;
             return {
                 label: filename,
-                data: results.map((r, i) => ({ x: i, y: r.latency / 1000000 })),
+                data: data[filename].latency_series,
                 borderColor: colors[idx],
                 backgroundColor: colors[idx] + '20',
                 borderWidth: 2,
@@ -230,6 +300,21 @@ def main():
             };
         });
 
+        // GC stop-the-world pauses on the same time axis
+        filenames.forEach((filename, idx) => {
+            const go = data[filename].go;
+            if (!go) return;
+            latencyDatasets.push({
+                label: filename + ' (GC pause)',
+                data: go.gc_events.map(e => ({ x: e.t, y: e.pause_ms })),
+                borderColor: colors[idx],
+                backgroundColor: colors[idx],
+                showLine: false,
+                pointStyle: 'triangle',
+                pointRadius: 4
+            });
+        });
+
         new Chart(document.getElementById('latencyTimeChart'), {
             type: 'line',
             data: { datasets: latencyDatasets },
@@ -240,34 +325,17 @@ def main():
                     y: { beginAtZero: true, title: { display: true, text: 'Latency (ms)' } },
                     x: {
                         type: 'linear',
-                        title: { display: true, text: 'Sample Number' }
+                        title: { display: true, text: 'Time (seconds)' }
                     }
                 }
             }
         });
 
-        // RPS Over Time (using 100ms buckets)
+        // RPS Over Time (100ms windows over all requests)
         const allRpsDatasets = [];
 
         filenames.forEach((filename, idx) => {
-            const results = data[filename].results;
-            const startTime = new Date(results[0].timestamp).getTime();
-            const bucketSize = 100;
-            const rpsBuckets = {};
-
-            results.forEach(r => {
-                const elapsed = new Date(r.timestamp).getTime() - startTime;
-                const bucket = Math.floor(elapsed / bucketSize);
-                rpsBuckets[bucket] = (rpsBuckets[bucket] || 0) + 1;
-            });
-
-            // Extrapolate to RPS based on sample rate
-            const sampleRate = data[filename].sample_rate;
-
-            const rpsData = Object.keys(rpsBuckets).sort((a, b) => a - b).map(bucket => ({
-                x: bucket * bucketSize / 1000,
-                y: (rpsBuckets[bucket] * sampleRate / bucketSize) * 1000
-            }));
+            const rpsData = data[filename].rps_series;
 
             // Instantaneous data
             allRpsDatasets.push({
@@ -295,8 +363,27 @@ def main():
                 pointRadius: 0,
                 fill: false
             });
+
+            // Go heap size at the start of each GC cycle
+            const go = data[filename].go;
+            if (go) {
+                allRpsDatasets.push({
+                    label: filename + ' (Go heap MB)',
+                    data: go.gc_events.map(e => ({ x: e.t, y: e.heap_mb })),
+                    yAxisID: 'heap',
+                    borderColor: colors[idx],
+                    borderWidth: 1,
+                    borderDash: [2, 2],
+                    pointStyle: 'triangle',
+                    pointRadius: 3,
+                    stepped: true,
+                    fill: false
+                });
+            }
         });
 
+        const hasGo = filenames.some(f => data[f].go);
+
         new Chart(document.getElementById('rpsTimeChart'), {
             type: 'line',
             data: { datasets: allRpsDatasets },
@@ -305,6 +392,13 @@ def main():
                 maintainAspectRatio: true,
                 scales: {
                     y: { beginAtZero: true, title: { display: true, text: 'Requests/sec' } },
+                    heap: {
+                        display: hasGo,
+                        position: 'right',
+                        beginAtZero: true,
+                        grid: { drawOnChartArea: false },
+                        title: { display: true, text: 'Go heap (MB)' }
+                    },
                     x: {
                         type: 'linear',
                         title: { display: true, text: 'Time (seconds)' }
@@ -312,6 +406,66 @@ def main():
                 }
             }
         });
+
+        // Latency histogram, log-spaced bins plotted at their geometric center
+        new Chart(document.getElementById('latencyHistogramChart'), {
+            type: 'line',
+            data: {
+                datasets: filenames.map((filename, idx) => {
+                    const hist = data[filename].histogram;
+                    const total = hist.counts.reduce((a, b) => a + b, 0);
+                    return {
+                        label: filename,
+                        data: hist.counts.map((count, i) => ({
+                            x: Math.sqrt(hist.edges[i] * hist.edges[i + 1]),
+                            y: count * 100 / total
+                        })),
+                        borderColor: colors[idx],
+                        borderWidth: 2,
+                        pointRadius: 0,
+                        stepped: 'middle'
+                    };
+                })
+            },
+            options: {
+                responsive: true,
+                maintainAspectRatio: true,
+                scales: {
+                    y: { beginAtZero: true, title: { display: true, text: 'Requests (%)' } },
+                    x: {
+                        type: 'logarithmic',
+                        title: { display: true, text: 'Latency (ms)' }
+                    }
+                }
+            }
+        });
+
+        if (hasGo) {
+            new Chart(document.getElementById('schedTimeChart'), {
+                type: 'line',
+                data: {
+                    datasets: filenames.filter(f => data[f].go).map(filename => ({
+                        label: filename,
+                        data: data[filename].go.sched_events.map(e => ({ x: e.t, y: e.runqueue })),
+                        borderColor: colors[filenames.indexOf(filename)],
+                        borderWidth: 2,
+                        pointRadius: 0,
+                        stepped: true
+                    }))
+                },
+                options: {
+                    responsive: true,
+                    maintainAspectRatio: true,
+                    scales: {
+                        y: { beginAtZero: true, title: { display: true, text: 'Global run queue' } },
+                        x: {
+                            type: 'linear',
+                            title: { display: true, text: 'Time (seconds)' }
+                        }
+                    }
+                }
+            });
+        }
     </script>
 </body>
 </html>'''
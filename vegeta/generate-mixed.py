@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+
+import sys
+from pathlib import Path
+from collections import defaultdict
+
+import numpy as np
+
+import analysis
+
+def get_endpoint_metrics(vegeta_bin):
+    """Split one mixed attack into per-endpoint latency and throughput"""
+    results = analysis.load(vegeta_bin)
+    timestamps, codes, latencies = results['timestamp'], results['code'], results['latency']
+    if not len(timestamps):
+        return {}
+    duration = float(timestamps.max() - timestamps.min()) / 1_000_000_000 or 1
+    ok = (codes >= 200) & (codes < 400)
+
+    # Endpoint (script name) of every distinct URL
+    names = np.array([Path(str(url)).name for url in results['urls']])
+
+    metrics = {}
+    for name in np.unique(names):
+        endpoint = np.isin(results['url'], np.flatnonzero(names == name))
+        requests = int(np.count_nonzero(endpoint))
+        endpoint_latencies = latencies[endpoint]
+        p50, p99, p999 = analysis.percentiles(endpoint_latencies, [50, 99, 99.9]) / 1_000_000
+        metrics[str(name)] = {
+            'share': round(requests * 100 / len(timestamps), 1),
+            'rps': round(requests / duration, 2),
+            'latency_mean': round(float(endpoint_latencies.mean()) / 1_000_000, 2),
+            'latency_50': round(float(p50), 2),
+            'latency_99': round(float(p99), 2),
+            'latency_999': round(float(p999), 2),
+            'success': round(np.count_nonzero(ok & endpoint) * 100 / requests)
+        }
+    return metrics
+
+def get_isolated_p99(vegeta_bin):
+    """p99 latency (ms) of the same script attacked on its own, None without results
+
+    Computed like the per-endpoint percentiles rather than with `vegeta
+    report`, so both sides of the comparison use the same method.
+    """
+    latencies = analysis.load(vegeta_bin)['latency']
+    if not len(latencies):
+        return None
+    return round(float(analysis.percentiles(latencies, [99])[0]) / 1_000_000, 2)
+
+def fmt_inflation(metrics):
+    """Mixed p99 relative to the isolated p99 (higher is worse)"""
+    isolated = metrics.get('isolated_99')
+    if not isolated:
+        return '-'
+    pct = (metrics['latency_99'] - isolated) / isolated * 100
+    pct_class = 'negative' if pct > 0 else 'positive'
+    return f'{isolated:.2f} ms <span class="{pct_class}">({pct:+.1f}%)</span>'
+
+def main():
+    vegeta_dir = Path('vegeta')
+    mixed_dir = vegeta_dir / 'mixed'
+    if not mixed_dir.exists():
+        print("Error: vegeta/mixed directory not found")
+        sys.exit(1)
+
+    # Organize data by endpoint and server
+    data = defaultdict(dict)
+
+    for bin_file in sorted(mixed_dir.glob('mixed-*.bin')):
+        server = bin_file.stem[len('mixed-'):]
+        print(f"Processing mixed - {server}...")
+
+        for endpoint, metrics in get_endpoint_metrics(bin_file).items():
+            # Compare with the isolated keep-alive run of the same script
+            isolated = vegeta_dir / 'h1' / f'{Path(endpoint).stem}-{server}.bin'
+            if isolated.exists():
+                metrics['isolated_99'] = get_isolated_p99(isolated)
+            data[endpoint][server] = metrics
+
+    if not data:
+        print("Error: No mixed workload data found")
+        sys.exit(1)
+
+    all_servers = sorted(set(server for endpoint_data in data.values() for server in endpoint_data.keys()))
+
+    html = '''<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Mixed Workload - All Servers</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }
+        .container { max-width: 1600px; margin: 0 auto; }
+        .header { background: #2c3e50; color: white; padding: 20px; border-radius: 5px; margin-bottom: 20px; }
+        table { width: 100%; background: white; border-collapse: collapse; margin-bottom: 30px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ecf0f1; }
+        th { background: #2c3e50; color: white; font-weight: 600; position: sticky; top: 0; }
+        tr:hover { background: #f8f9fa; }
+        .test-header { background: #34495e; color: white; font-weight: bold; font-size: 1.1em; }
+        .metric-label { font-weight: 600; color: #555; background: #ecf0f1; }
+        .positive { color: #27ae60; font-weight: 600; }
+        .negative { color: #e74c3c; font-weight: 600; }
+        .value { font-family: 'Courier New', monospace; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Mixed Workload - All Servers</h1>
+            <p>All endpoints attacked at once with the weighted mix from mix.txt, split per endpoint.
+            The p99 inflation compares with the same script attacked on its own (h1 keep-alive run) and
+            shows head-of-line blocking behind slower endpoints.</p>
+        </div>
+
+        <table>
+            <thead>
+                <tr>
+                    <th>Endpoint / Metric</th>
+'''
+
+    for server in all_servers:
+        html += f'                    <th>{server}</th>\n'
+
+    html += '''                </tr>
+            </thead>
+            <tbody>
+'''
+
+    rows = [
+        ('Share of requests', lambda m: f"{m['share']}%"),
+        ('Requests/sec', lambda m: f"{m['rps']:,.2f}"),
+        ('Mean Latency', lambda m: f"{m['latency_mean']:.2f} ms"),
+        ('50th Percentile', lambda m: f"{m['latency_50']:.2f} ms"),
+        ('99th Percentile', lambda m: f"{m['latency_99']:.2f} ms"),
+        ('99.9th Percentile', lambda m: f"{m['latency_999']:.2f} ms"),
+        ('p99 vs. isolated run', fmt_inflation),
+        ('Success Rate', lambda m: f"{m['success']}%"),
+    ]
+
+    for endpoint in sorted(data.keys()):
+        html += f'''                <tr class="test-header">
+                    <td colspan="{len(all_servers) + 1}">{endpoint}</td>
+                </tr>
+'''
+        for label, fmt in rows:
+            html += f'                <tr>\n                    <td class="metric-label">{label}</td>\n'
+            for server in all_servers:
+                if server in data[endpoint]:
+                    html += f'                    <td class="value">{fmt(data[endpoint][server])}</td>\n'
+                else:
+                    html += '                    <td>-</td>\n'
+            html += '                </tr>\n'
+
+    html += '''            </tbody>
+        </table>
+    </div>
+</body>
+</html>'''
+
+    output_file = 'mixed-table.html'
+    with open(output_file, 'w') as f:
+        f.write(html)
+
+    Path(output_file).chmod(0o666)
+    print(f"\nGenerated {output_file}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+import random
+import sys
+from pathlib import Path
+
+# Static assets served by the compression suite, name -> size in bytes
+SIZES = {
+    '1k': 1024,
+    '10k': 10 * 1024,
+    '100k': 100 * 1024,
+    '1m': 1024 * 1024,
+}
+
+WORDS = (
+    'lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod '
+    'tempor incididunt ut labore et dolore magna aliqua enim ad minim veniam '
+    'quis nostrud exercitation ullamco laboris nisi aliquip ex ea commodo'
+).split()
+
+def make_html(size, rng):
+    """Build a pseudo-random HTML document of exactly size bytes"""
+    head = '<!DOCTYPE html>\n<html>\n<head><title>Static asset</title></head>\n<body>\n'
+    tail = '</body>\n</html>\n'
+
+    parts = [head]
+    length = len(head) + len(tail)
+    while length < size:
+        words = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(8, 40)))
+        line = f'<p class="c{rng.randint(0, 99)}" data-id="{rng.getrandbits(32):08x}">{words}</p>\n'
+        parts.append(line)
+        length += len(line)
+
+    body = ''.join(parts)[:size - len(tail)]
+    return body + tail
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: generate-static.py <output_dir>")
+        sys.exit(1)
+
+    out_dir = Path(sys.argv[1])
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    # Fixed seed so every image serves byte-identical assets
+    rng = random.Random(42)
+    for name, size in SIZES.items():
+        path = out_dir / f'{name}.html'
+        path.write_text(make_html(size, rng))
+        print(f"Generated {path} ({size} bytes)")
+
+if __name__ == '__main__':
+    main()
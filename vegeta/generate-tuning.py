@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+
+import json
+import math
+import sys
+from pathlib import Path
+from collections import defaultdict
+
+import analysis
+
+# Settings that dropped requests are never picked as optimal
+MIN_SUCCESS = 99.0
+
+def fmt_params(params):
+    return ', '.join(f'{k}={v}' for k, v in params.items())
+
+def best(results):
+    """Throughput-optimal and p99-optimal result of one script on one server"""
+    ok = [r for r in results if r['success'] >= MIN_SUCCESS] or results
+    return {
+        'rps': max(ok, key=lambda r: r['rps']),
+        'p99': min(ok, key=lambda r: r['latency_99'])
+    }
+
+def fmt_best(result, metric, baseline):
+    """Best value with the setting that produced it and the delta to the first server"""
+    if metric == 'rps':
+        value = f"{result['rps']:,.2f}"
+    else:
+        value = f"{result['latency_99']:.2f} ms"
+
+    delta = ''
+    if baseline is not None and baseline is not result:
+        key = 'rps' if metric == 'rps' else 'latency_99'
+        pct = float(analysis.deltas(result[key], baseline[key]))
+        # No percentage against a baseline of 0, e.g. when all its requests failed
+        if not math.isnan(pct):
+            pct_class = 'positive' if (pct > 0) == (metric == 'rps') else 'negative'
+            delta = f' <span class="{pct_class}">({pct:+.1f}%)</span>'
+
+    return f'{value}{delta}<br><span class="setting">{fmt_params(result["params"])}</span>'
+
+def curves(knobs, results):
+    """Sensitivity curves: the last knob on the x axis, one series per combination of the others"""
+    x_knob = knobs[-1]
+    series = defaultdict(list)
+    for r in results:
+        others = {k: v for k, v in r['params'].items() if k != x_knob}
+        series[fmt_params(others) or 'all'].append({
+            'x': r['params'][x_knob],
+            'rps': r['rps'],
+            'p99': r['latency_99']
+        })
+    return {'x_knob': x_knob, 'series': dict(series)}
+
+def main():
+    tune_dir = Path('vegeta') / 'tune'
+    if not tune_dir.exists():
+        print("Error: vegeta/tune directory not found")
+        sys.exit(1)
+
+    # Organize data by script and server
+    data = defaultdict(dict)
+    charts = defaultdict(dict)
+
+    for json_file in sorted(tune_dir.glob('tune-*.json')):
+        report = json.loads(json_file.read_text())
+        server = report['server']
+
+        by_script = defaultdict(list)
+        for result in report['results']:
+            by_script[result['script']].append(result)
+
+        for script, results in by_script.items():
+            print(f"Processing {script} - {server} ({len(results)} settings)...")
+            data[script][server] = best(results)
+            charts[script][server] = curves(report['knobs'], results)
+
+    if not data:
+        print("Error: No tuning data found")
+        sys.exit(1)
+
+    all_servers = sorted(set(server for script_data in data.values() for server in script_data.keys()))
+
+    html = '''<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Worker Pool Tuning - All Servers</title>
+    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; background: #f5f5f5; }
+        .container { max-width: 1600px; margin: 0 auto; }
+        .header { background: #2c3e50; color: white; padding: 20px; border-radius: 5px; margin-bottom: 20px; }
+        table { width: 100%; background: white; border-collapse: collapse; margin-bottom: 30px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ecf0f1; }
+        th { background: #2c3e50; color: white; font-weight: 600; position: sticky; top: 0; }
+        tr:hover { background: #f8f9fa; }
+        .test-header { background: #34495e; color: white; font-weight: bold; font-size: 1.1em; }
+        .metric-label { font-weight: 600; color: #555; background: #ecf0f1; }
+        .positive { color: #27ae60; font-weight: 600; }
+        .negative { color: #e74c3c; font-weight: 600; }
+        .value { font-family: 'Courier New', monospace; }
+        .setting { color: #999; font-size: 0.85em; }
+        .charts { display: grid; grid-template-columns: repeat(auto-fit, minmax(600px, 1fr)); gap: 20px; margin-bottom: 20px; }
+        .chart-container { background: white; padding: 20px; border-radius: 5px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        canvas { max-height: 400px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Worker Pool Tuning - All Servers</h1>
+            <p>Each server's best setting per script, compared best against best. Settings with less than ''' + f'{MIN_SUCCESS:g}' + '''% successful
+            requests are not considered. The curves show throughput (solid) and p99 latency (dashed) over the swept settings.</p>
+        </div>
+
+        <table>
+            <thead>
+                <tr>
+                    <th>Script / Metric</th>
+'''
+
+    for server in all_servers:
+        html += f'                    <th>{server}</th>\n'
+
+    html += '''                </tr>
+            </thead>
+            <tbody>
+'''
+
+    rows = [
+        ('Best Requests/sec', 'rps'),
+        ('Best 99th Percentile', 'p99'),
+    ]
+
+    for script in sorted(data.keys()):
+        html += f'''                <tr class="test-header">
+                    <td colspan="{len(all_servers) + 1}">{script}</td>
+                </tr>
+'''
+        for label, metric in rows:
+            baseline = data[script][all_servers[0]][metric] if all_servers[0] in data[script] else None
+            html += f'                <tr>\n                    <td class="metric-label">{label}</td>\n'
+            for server in all_servers:
+                if server in data[script]:
+                    html += f'                    <td class="value">{fmt_best(data[script][server][metric], metric, baseline)}</td>\n'
+                else:
+                    html += '                    <td>-</td>\n'
+            html += '                </tr>\n'
+
+    html += '''            </tbody>
+        </table>
+'''
+
+    chart_ids = []
+    for script in sorted(charts.keys()):
+        html += f'''
+        <h2>{script}</h2>
+        <div class="charts">
+'''
+        for server in sorted(charts[script].keys()):
+            chart_ids.append((script, server))
+            html += f'''            <div class="chart-container">
+                <h3>{server}</h3>
+                <canvas id="chart{len(chart_ids) - 1}"></canvas>
+            </div>
+'''
+        html += '        </div>\n'
+
+    html += '''    </div>
+
+    <script>
+        const charts = ''' + json.dumps(charts) + ''';
+        const chartIds = ''' + json.dumps(chart_ids) + ''';
+        const colors = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6', '#1abc9c'];
+
+        chartIds.forEach(([script, server], idx) => {
+            const chart = charts[script][server];
+            const names = Object.keys(chart.series);
+            const labels = [...new Set(names.flatMap(name => chart.series[name].map(p => p.x)))];
+            const datasets = [];
+            names.forEach((name, i) => {
+                const color = colors[i % colors.length];
+                const points = chart.series[name];
+                datasets.push({
+                    label: name + ' req/s',
+                    data: points.map(p => ({ x: p.x, y: p.rps })),
+                    borderColor: color,
+                    borderWidth: 2,
+                    yAxisID: 'rps'
+                });
+                datasets.push({
+                    label: name + ' p99',
+                    data: points.map(p => ({ x: p.x, y: p.p99 })),
+                    borderColor: color,
+                    borderWidth: 2,
+                    borderDash: [6, 4],
+                    yAxisID: 'p99'
+                });
+            });
+
+            new Chart(document.getElementById('chart' + idx), {
+                type: 'line',
+                data: { labels: labels, datasets: datasets },
+                options: {
+                    responsive: true,
+                    maintainAspectRatio: true,
+                    scales: {
+                        x: { title: { display: true, text: chart.x_knob } },
+                        rps: { type: 'linear', position: 'left', beginAtZero: true, title: { display: true, text: 'Requests/sec' } },
+                        p99: { type: 'linear', position: 'right', beginAtZero: true, grid: { drawOnChartArea: false }, title: { display: true, text: 'p99 latency (ms)' } }
+                    }
+                }
+            });
+        });
+    </script>
+</body>
+</html>'''
+
+    output_file = 'tuning-table.html'
+    with open(output_file, 'w') as f:
+        f.write(html)
+
+    Path(output_file).chmod(0o666)
+    print(f"\nGenerated {output_file}")
+
+if __name__ == '__main__':
+    main()
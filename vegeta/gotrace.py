@@ -0,0 +1,69 @@
+"""Parse Go runtime traces written by FrankenPHP with GODEBUG=gctrace=1,schedtrace=N.
+
+bench-server writes the trace to GO_TRACE_LOG and the launch time
+(unix ns) to GO_TRACE_LOG.start; trace timestamps are relative to it.
+"""
+
+import re
+from pathlib import Path
+
+import numpy as np
+
+import analysis
+
+# gc 12 @3.456s 1%: 0.021+1.2+0.015 ms clock, ..., 4->4->2 MB, 5 MB goal, ...
+GC_RE = re.compile(
+    r'^gc (\d+) @([\d.]+)s \d+%: ([\d.]+)\+([\d.]+)\+([\d.]+) ms clock, '
+    r'.*? (\d+)->(\d+)->(\d+) MB, (\d+) MB goal'
+)
+# SCHED 1004ms: gomaxprocs=8 idleprocs=6 threads=15 ... runqueue=0 [...]
+SCHED_RE = re.compile(
+    r'^SCHED (\d+)ms: gomaxprocs=(\d+) idleprocs=(\d+) threads=(\d+) .*?runqueue=(\d+)'
+)
+
+def load(log_path):
+    """Return GC cycles and scheduler samples with absolute timestamps (unix ns)"""
+    log_path = Path(log_path)
+    start_ns = int(Path(f'{log_path}.start').read_text().strip())
+
+    gc = []
+    sched = []
+    for line in log_path.read_text(errors='replace').splitlines():
+        m = GC_RE.match(line)
+        if m:
+            stw_sweep, concurrent, stw_mark = (float(v) for v in m.group(3, 4, 5))
+            cycle_start = start_ns + int(float(m.group(2)) * 1_000_000_000)
+            gc.append({
+                'cycle': int(m.group(1)),
+                'start_ns': cycle_start,
+                'end_ns': cycle_start + int((stw_sweep + concurrent + stw_mark) * 1_000_000),
+                'pause_ms': round(stw_sweep + stw_mark, 3),
+                'heap_start_mb': int(m.group(6)),
+                'heap_end_mb': int(m.group(7)),
+                'heap_live_mb': int(m.group(8)),
+                'heap_goal_mb': int(m.group(9))
+            })
+            continue
+
+        m = SCHED_RE.match(line)
+        if m:
+            sched.append({
+                'ts_ns': start_ns + int(m.group(1)) * 1_000_000,
+                'gomaxprocs': int(m.group(2)),
+                'idleprocs': int(m.group(3)),
+                'threads': int(m.group(4)),
+                'runqueue': int(m.group(5))
+            })
+
+    gc.sort(key=lambda e: e['start_ns'])
+    return {'gc': gc, 'sched': sched}
+
+def gc_time_fraction(gc, start_ns, end_ns):
+    """Share of [start_ns, end_ns] spent inside GC cycles"""
+    if end_ns <= start_ns or not gc:
+        return 0.0
+    starts = np.array([e['start_ns'] for e in gc])
+    ends = np.array([e['end_ns'] for e in gc])
+    overlapping = analysis.in_intervals(starts, ends, [start_ns], [end_ns])
+    busy = np.minimum(ends[overlapping], end_ns) - np.maximum(starts[overlapping], start_ns)
+    return float(busy.sum()) / (end_ns - start_ns)
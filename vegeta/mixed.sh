@@ -0,0 +1,41 @@
+#!/bin/bash
+# Mixed-workload suite.
+#
+# Sends a weighted traffic mix (mix.txt) to all scripts at once from a single
+# vegeta attack, so fast and slow endpoints compete for the same PHP workers.
+# generate-mixed.py splits the result stream per endpoint.
+set -e
+
+MIX_FILE=${BENCH_MIX_FILE:-/app/mix.txt}
+RATE=${BENCH_MIX_RATE:-0}
+OUT_DIR=/app/vegeta/mixed
+
+mkdir -p "$OUT_DIR"
+
+echo "=== mixed ==="
+grep -v '^#' "$MIX_FILE"
+echo ""
+
+# Smooth weighted round-robin: every script is spread evenly over the
+# target list instead of being sent in bursts
+TARGETS=$(awk '
+    !/^#/ && NF == 2 { weight[++n] = $1; script[n] = $2; total += $1 }
+    END {
+        for (k = 0; k < total; k++) {
+            best = 0
+            for (i = 1; i <= n; i++) {
+                current[i] += weight[i]
+                if (!best || current[i] > current[best]) best = i
+            }
+            current[best] -= total
+            printf "GET http://localhost:80/%s\n\n", script[best]
+        }
+    }
+' "$MIX_FILE")
+
+bin="${OUT_DIR}/mixed-${BENCH_NAME}.bin"
+echo "$TARGETS" | vegeta attack -duration=${WRK_TIME}s -rate=${RATE} -max-workers=${WRK_CONNECTIONS} > "$bin"
+vegeta report "$bin"
+echo ""
+
+cd /app && python3 /app/generate-mixed.py
@@ -0,0 +1,44 @@
+# Protocol and connection-reuse matrix shared by the benchmark scripts.
+#
+#   h1-close  HTTP/1.1, new connection per request
+#   h1        HTTP/1.1 keep-alive (the original setup)
+#   h1-tls    HTTP/1.1 over TLS
+#   h2        HTTP/2 over TLS
+#   h2c       HTTP/2 over cleartext (prior knowledge)
+#   h3        HTTP/3 over QUIC (served, but vegeta has no QUIC client)
+#
+# protocol_target <protocol> sets BASE_URL and ATTACK_FLAGS for vegeta and
+# returns non-zero when vegeta cannot drive the protocol.
+
+protocol_target() {
+    case "$1" in
+        h1-close)
+            BASE_URL="http://localhost:80"
+            ATTACK_FLAGS="-keepalive=false"
+            ;;
+        h1)
+            BASE_URL="http://localhost:80"
+            ATTACK_FLAGS=""
+            ;;
+        h1-tls)
+            BASE_URL="https://localhost:443"
+            ATTACK_FLAGS="-http2=false -root-certs=/certs/ca.pem"
+            ;;
+        h2)
+            BASE_URL="https://localhost:443"
+            ATTACK_FLAGS="-http2 -root-certs=/certs/ca.pem"
+            ;;
+        h2c)
+            BASE_URL="http://localhost:8080"
+            ATTACK_FLAGS="-h2c"
+            ;;
+        h3)
+            echo "Skipping h3: vegeta has no HTTP/3 client" >&2
+            return 1
+            ;;
+        *)
+            echo "Skipping unknown protocol: $1" >&2
+            return 1
+            ;;
+    esac
+}
@@ -4,16 +4,24 @@ set -e
 
 CONNECTIONS=${1:-20}
 TIME=${2:-15}
+PROTOCOLS=${3:-"h1-close h1 h1-tls h2 h2c"}
+SUITES=${4:-"scripts"}
+GO_TRACE=${5:-0}
+CLIENTS=${6:-1}
 
 for dockerfile in *.Dockerfile; do
     basename="${dockerfile%.Dockerfile}"
     image_name="${basename}-bench"
     docker build -q -f "$dockerfile" -t "$image_name" \
         --build-arg WRK_CONNECTIONS="$CONNECTIONS" \
-        --build-arg WRK_TIME="$TIME" .
+        --build-arg WRK_TIME="$TIME" \
+        --build-arg BENCH_PROTOCOLS="$PROTOCOLS" \
+        --build-arg BENCH_SUITES="$SUITES" \
+        --build-arg BENCH_GO_TRACE="$GO_TRACE" \
+        --build-arg BENCH_CLIENTS="$CLIENTS" .
 done
 
-echo "Build complete (connections=$CONNECTIONS, time=$TIME)"
+echo "Build complete (connections=$CONNECTIONS, time=$TIME, protocols=$PROTOCOLS, suites=$SUITES, go_trace=$GO_TRACE, clients=$CLIENTS)"
 echo ""
 
 for dockerfile in *.Dockerfile; do
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+import itertools
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Space separated KNOB=v1,v2,... entries; every combination is benchmarked.
+# The knobs are environment variables read by bench-server.
+GRID = os.environ.get('BENCH_TUNE_GRID', '')
+TUNE_TIME = int(os.environ.get('BENCH_TUNE_TIME', 5))
+CONNECTIONS = int(os.environ.get('WRK_CONNECTIONS', 20))
+
+def parse_grid(grid):
+    """'A=1,2 B=x' -> [('A', ['1', '2']), ('B', ['x'])]"""
+    knobs = []
+    for entry in grid.split():
+        name, _, values = entry.partition('=')
+        knobs.append((name, values.split(',')))
+    return knobs
+
+def valid(params):
+    """FrankenPHP refuses max_threads below num_threads"""
+    num = params.get('FRANKENPHP_NUM_THREADS', '')
+    max_threads = params.get('FRANKENPHP_MAX_THREADS', '')
+    if num.isdigit() and max_threads.isdigit():
+        return int(max_threads) >= int(num)
+    return True
+
+def attack(script):
+    """Short closed-loop attack against one script, return vegeta's JSON report"""
+    with tempfile.NamedTemporaryFile(suffix='.bin') as vegeta_bin:
+        subprocess.run(
+            ['vegeta', 'attack', f'-duration={TUNE_TIME}s', '-rate=0', f'-max-workers={CONNECTIONS}'],
+            input=f'GET http://localhost:80/{script}\n'.encode(),
+            stdout=vegeta_bin,
+            check=True
+        )
+        result = subprocess.run(
+            ['vegeta', 'report', '-type=json', vegeta_bin.name],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    return json.loads(result.stdout)
+
+def main():
+    if len(sys.argv) < 3:
+        print("Usage: tune.py <bench_name> <script1> [script2] ...")
+        sys.exit(1)
+
+    bench_name = sys.argv[1]
+    scripts = [Path(s).name for s in sys.argv[2:]]
+
+    knobs = parse_grid(GRID)
+    if not knobs:
+        print("Error: BENCH_TUNE_GRID is empty")
+        sys.exit(1)
+
+    names = [name for name, _ in knobs]
+    points = [dict(zip(names, values)) for values in itertools.product(*(values for _, values in knobs))]
+    points = [params for params in points if valid(params)]
+
+    results = []
+    for idx, params in enumerate(points, 1):
+        label = ' '.join(f'{k}={v}' for k, v in params.items())
+        print(f"--- tuning {idx}/{len(points)}: {label} ---")
+
+        subprocess.run(['bench-server', 'stop'], check=True)
+        subprocess.run(['bench-server', 'start'], check=True, env={**os.environ, **params})
+
+        for script in scripts:
+            report = attack(script)
+            result = {
+                'script': script,
+                'params': params,
+                'rps': round(report['rate'], 2),
+                'latency_50': round(report['latencies']['50th'] / 1_000_000, 2),
+                'latency_99': round(report['latencies']['99th'] / 1_000_000, 2),
+                'success': round(report['success'] * 100, 2)
+            }
+            print(f"  {script}: {result['rps']:,.2f} req/s, p99 {result['latency_99']:.2f} ms, {result['success']}% ok")
+            results.append(result)
+
+    subprocess.run(['bench-server', 'stop'], check=True)
+
+    out_dir = Path('/app/vegeta/tune')
+    out_dir.mkdir(parents=True, exist_ok=True)
+    output_file = out_dir / f"tune-{bench_name}.json"
+    output_file.write_text(json.dumps({
+        'server': bench_name,
+        'knobs': names,
+        'tune_time_s': TUNE_TIME,
+        'connections': CONNECTIONS,
+        'results': results
+    }, indent=2))
+    output_file.chmod(0o666)
+    print(f"Tuning results: {output_file}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,218 @@
+<?php
+
+// Build-time fixtures for the app_* scripts: the SQLite database, the
+// generated service providers and listeners, a cached config and the
+// session directory. Data is seeded, every image gets the same fixtures.
+//
+// Usage: php fixtures.php <dir>
+
+const CATEGORIES = 20;
+const PRODUCTS = 1000;
+const REVIEWS_PER_PRODUCT = 8;
+const CUSTOMERS = 500;
+const ORDERS = 5000;
+const PROVIDERS = 60;
+const SESSION_POOL = 1000;
+
+const WORDS = [
+    'lorem', 'ipsum', 'dolor', 'sit', 'amet', 'consectetur', 'adipiscing', 'elit',
+    'sed', 'do', 'eiusmod', 'tempor', 'incididunt', 'ut', 'labore', 'et', 'dolore',
+    'magna', 'aliqua', 'enim', 'ad', 'minim', 'veniam', 'quis', 'nostrud',
+    'exercitation', 'ullamco', 'laboris', 'nisi', 'aliquip', 'ex', 'ea', 'commodo',
+];
+
+function words(int $count): string
+{
+    $out = [];
+    for ($i = 0; $i < $count; $i++) {
+        $out[] = WORDS[mt_rand(0, count(WORDS) - 1)];
+    }
+    return implode(' ', $out);
+}
+
+function write_database(string $path): void
+{
+    @unlink($path);
+    $pdo = new PDO('sqlite:' . $path, null, null, [PDO::ATTR_ERRMODE => PDO::ERRMODE_EXCEPTION]);
+    $pdo->exec(<<<'SQL'
+        CREATE TABLE categories (id INTEGER PRIMARY KEY, name TEXT NOT NULL, slug TEXT NOT NULL UNIQUE);
+        CREATE TABLE products (
+            id INTEGER PRIMARY KEY,
+            category_id INTEGER NOT NULL REFERENCES categories(id),
+            sku TEXT NOT NULL,
+            name TEXT NOT NULL,
+            description TEXT NOT NULL,
+            price_cents INTEGER NOT NULL,
+            stock INTEGER NOT NULL,
+            attributes TEXT NOT NULL
+        );
+        CREATE INDEX products_category ON products(category_id);
+        CREATE TABLE reviews (
+            id INTEGER PRIMARY KEY,
+            product_id INTEGER NOT NULL REFERENCES products(id),
+            author TEXT NOT NULL,
+            rating INTEGER NOT NULL,
+            body TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        );
+        CREATE INDEX reviews_product ON reviews(product_id, created_at);
+        CREATE TABLE customers (id INTEGER PRIMARY KEY, name TEXT NOT NULL, email TEXT NOT NULL);
+        CREATE TABLE orders (
+            id INTEGER PRIMARY KEY,
+            customer_id INTEGER NOT NULL REFERENCES customers(id),
+            status TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            items TEXT NOT NULL
+        );
+        CREATE INDEX orders_customer ON orders(customer_id, created_at);
+        SQL);
+
+    $pdo->beginTransaction();
+
+    $insert = $pdo->prepare('INSERT INTO categories (id, name, slug) VALUES (?, ?, ?)');
+    for ($id = 1; $id <= CATEGORIES; $id++) {
+        $name = ucwords(words(2));
+        $insert->execute([$id, $name, str_replace(' ', '-', $name) . '-' . $id]);
+    }
+
+    $insert = $pdo->prepare('INSERT INTO products VALUES (?, ?, ?, ?, ?, ?, ?, ?)');
+    for ($id = 1; $id <= PRODUCTS; $id++) {
+        $attributes = [];
+        for ($i = mt_rand(3, 12); $i > 0; $i--) {
+            $attributes[words(1) . $i] = words(mt_rand(1, 4));
+        }
+        $insert->execute([
+            $id,
+            mt_rand(1, CATEGORIES),
+            sprintf('SKU-%06d', $id),
+            ucfirst(words(mt_rand(2, 5))),
+            ucfirst(words(mt_rand(40, 120))) . '.',
+            mt_rand(199, 99999),
+            mt_rand(0, 500),
+            json_encode($attributes),
+        ]);
+    }
+
+    $insert = $pdo->prepare('INSERT INTO reviews (product_id, author, rating, body, created_at) VALUES (?, ?, ?, ?, ?)');
+    for ($id = 1; $id <= PRODUCTS; $id++) {
+        for ($i = mt_rand(0, 2 * REVIEWS_PER_PRODUCT); $i > 0; $i--) {
+            $insert->execute([
+                $id,
+                ucwords(words(2)),
+                mt_rand(1, 5),
+                ucfirst(words(mt_rand(10, 60))) . '.',
+                date('Y-m-d H:i:s', 1_700_000_000 + mt_rand(0, 30_000_000)),
+            ]);
+        }
+    }
+
+    $insert = $pdo->prepare('INSERT INTO customers VALUES (?, ?, ?)');
+    for ($id = 1; $id <= CUSTOMERS; $id++) {
+        $insert->execute([$id, ucwords(words(2)), "customer{$id}@example.com"]);
+    }
+
+    $statuses = ['pending', 'paid', 'shipped', 'delivered', 'cancelled'];
+    $insert = $pdo->prepare('INSERT INTO orders VALUES (?, ?, ?, ?, ?)');
+    for ($id = 1; $id <= ORDERS; $id++) {
+        $items = [];
+        for ($i = mt_rand(1, 8); $i > 0; $i--) {
+            $items[] = ['product_id' => mt_rand(1, PRODUCTS), 'quantity' => mt_rand(1, 5)];
+        }
+        $insert->execute([
+            $id,
+            mt_rand(1, CUSTOMERS),
+            $statuses[mt_rand(0, count($statuses) - 1)],
+            date('Y-m-d H:i:s', 1_700_000_000 + mt_rand(0, 30_000_000)),
+            json_encode($items),
+        ]);
+    }
+
+    $pdo->commit();
+}
+
+// One provider and one listener per PROVIDERS, booted on every request,
+// to get a framework-sized number of autoloaded classes.
+function write_providers(string $dir): array
+{
+    @mkdir("$dir/src/Provider", 0755, true);
+    @mkdir("$dir/src/Listener", 0755, true);
+
+    $providers = [];
+    for ($n = 0; $n < PROVIDERS; $n++) {
+        $event = $n % 2 ? 'kernel.response' : 'kernel.request';
+
+        $rules = '';
+        for ($i = mt_rand(3, 10); $i > 0; $i--) {
+            $rules .= sprintf("        '%s' => '%s',\n", str_replace(' ', '.', words(2)) . ".$n.$i", words(mt_rand(1, 6)));
+        }
+
+        file_put_contents("$dir/src/Listener/Listener{$n}.php", <<<PHP
+            <?php
+
+            namespace Bench\Generated\Listener;
+
+            final class Listener{$n}
+            {
+                private const RULES = [
+            {$rules}    ];
+
+                public function handle(object \$subject): void
+                {
+                    foreach (self::RULES as \$key => \$value) {
+                        \$subject->attributes[\$key] ??= \$value;
+                    }
+                }
+            }
+
+            PHP);
+
+        file_put_contents("$dir/src/Provider/Provider{$n}.php", <<<PHP
+            <?php
+
+            namespace Bench\Generated\Provider;
+
+            use Bench\Container;
+            use Bench\Events;
+            use Bench\Generated\Listener\Listener{$n};
+
+            final class Provider{$n}
+            {
+                public function register(Container \$container): void
+                {
+                    \$container->set(Listener{$n}::class, fn () => new Listener{$n}());
+                }
+
+                public function boot(Events \$events): void
+                {
+                    \$events->listen('{$event}', Listener{$n}::class);
+                }
+            }
+
+            PHP);
+
+        $providers[] = "Bench\\Generated\\Provider\\Provider{$n}";
+    }
+    return $providers;
+}
+
+$dir = rtrim($argv[1] ?? '/srv/app', '/');
+@mkdir($dir, 0755, true);
+mt_srand(42);
+
+write_database("$dir/app.sqlite");
+$providers = write_providers($dir);
+
+@mkdir("$dir/sessions", 0777, true);
+chmod("$dir/sessions", 01777);
+
+$config = [
+    'database' => "$dir/app.sqlite",
+    'sessions' => "$dir/sessions",
+    'session_pool' => SESSION_POOL,
+    'products' => PRODUCTS,
+    'orders' => ORDERS,
+    'providers' => $providers,
+];
+file_put_contents("$dir/config.php", "<?php\n\nreturn " . var_export($config, true) . ";\n");
+
+echo "Fixtures written to $dir\n";
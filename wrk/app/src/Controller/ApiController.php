@@ -0,0 +1,83 @@
+<?php
+
+namespace Bench\Controller;
+
+use Bench\Container;
+use Bench\Http\JsonResponse;
+use Bench\Http\Request;
+use Bench\Repository\OrderRepository;
+use Bench\Repository\ProductRepository;
+
+final class ApiController
+{
+    private const TAX_RATE = 0.2;
+
+    private readonly ProductRepository $products;
+    private readonly OrderRepository $orders;
+
+    public function __construct(Container $container)
+    {
+        $this->products = $container->get(ProductRepository::class);
+        $this->orders = $container->get(OrderRepository::class);
+    }
+
+    public function product(Request $request, string $id): JsonResponse
+    {
+        $product = $this->products->find((int) $id);
+        if ($product === null) {
+            return new JsonResponse(['error' => 'Product not found'], 404);
+        }
+
+        return new JsonResponse([
+            'id' => $product['id'],
+            'sku' => $product['sku'],
+            'name' => $product['name'],
+            'price' => $product['price_cents'] / 100,
+            'in_stock' => $product['stock'] > 0,
+            'category' => ['name' => $product['category_name'], 'slug' => $product['category_slug']],
+            'attributes' => $product['attributes'],
+            'rating' => $this->products->rating($product['id']),
+        ]);
+    }
+
+    public function order(Request $request, string $id): JsonResponse
+    {
+        $order = $this->orders->find((int) $id);
+        if ($order === null) {
+            return new JsonResponse(['error' => 'Order not found'], 404);
+        }
+
+        $products = $this->products->findMany(array_unique(array_column($order['items'], 'product_id')));
+        $lines = [];
+        $subtotal = 0;
+        foreach ($order['items'] as $item) {
+            $product = $products[$item['product_id']];
+            $total = $product['price_cents'] * $item['quantity'];
+            $subtotal += $total;
+            $lines[] = [
+                'sku' => $product['sku'],
+                'name' => $product['name'],
+                'quantity' => $item['quantity'],
+                'unit_price' => $product['price_cents'] / 100,
+                'total' => $total / 100,
+            ];
+        }
+        $tax = (int) round($subtotal * self::TAX_RATE);
+
+        return new JsonResponse([
+            'id' => $order['id'],
+            'status' => $order['status'],
+            'created_at' => $order['created_at'],
+            'customer' => ['name' => $order['customer_name'], 'email' => $order['customer_email']],
+            'lines' => $lines,
+            'subtotal' => $subtotal / 100,
+            'tax' => $tax / 100,
+            'total' => ($subtotal + $tax) / 100,
+        ]);
+    }
+
+    public function customerOrders(Request $request, string $id): JsonResponse
+    {
+        return new JsonResponse(['orders' => $this->orders->forCustomer((int) $id, 20)]);
+    }
+}
@@ -0,0 +1,38 @@
+<?php
+
+namespace Bench\Database;
+
+final class Connection
+{
+    private \PDO $pdo;
+    /** @var \PDOStatement[] */
+    private array $statements = [];
+
+    public function __construct(string $path)
+    {
+        $this->pdo = new \PDO('sqlite:' . $path, null, null, [
+            \PDO::ATTR_ERRMODE => \PDO::ERRMODE_EXCEPTION,
+            \PDO::ATTR_DEFAULT_FETCH_MODE => \PDO::FETCH_ASSOC,
+        ]);
+    }
+
+    public function fetchAll(string $sql, array $params = []): array
+    {
+        return $this->execute($sql, $params)->fetchAll();
+    }
+
+    public function fetchOne(string $sql, array $params = []): ?array
+    {
+        $statement = $this->execute($sql, $params);
+        $row = $statement->fetch();
+        $statement->closeCursor();
+        return $row === false ? null : $row;
+    }
+
+    private function execute(string $sql, array $params): \PDOStatement
+    {
+        $statement = $this->statements[$sql] ??= $this->pdo->prepare($sql);
+        $statement->execute($params);
+        return $statement;
+    }
+}
@@ -0,0 +1,24 @@
+<?php
+
+namespace Bench;
+
+final class Events
+{
+    private array $listeners = [];
+
+    public function __construct(private readonly Container $container)
+    {
+    }
+
+    public function listen(string $event, string $service): void
+    {
+        $this->listeners[$event][] = $service;
+    }
+
+    public function dispatch(string $event, object $subject): void
+    {
+        foreach ($this->listeners[$event] ?? [] as $service) {
+            $this->container->get($service)->handle($subject);
+        }
+    }
+}
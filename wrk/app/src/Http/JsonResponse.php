@@ -0,0 +1,15 @@
+<?php
+
+namespace Bench\Http;
+
+final class JsonResponse extends Response
+{
+    public function __construct(mixed $data, int $status = 200)
+    {
+        parent::__construct(
+            json_encode($data, JSON_THROW_ON_ERROR | JSON_UNESCAPED_SLASHES),
+            $status,
+            ['Content-Type' => 'application/json'],
+        );
+    }
+}
@@ -0,0 +1,24 @@
+<?php
+
+namespace Bench\Http;
+
+class Response
+{
+    public array $attributes = [];
+
+    public function __construct(
+        public string $body = '',
+        public int $status = 200,
+        public array $headers = ['Content-Type' => 'text/html; charset=UTF-8'],
+    ) {
+    }
+
+    public function send(): void
+    {
+        http_response_code($this->status);
+        foreach ($this->headers as $name => $value) {
+            header("$name: $value");
+        }
+        echo $this->body;
+    }
+}
@@ -0,0 +1,66 @@
+<?php
+
+namespace Bench;
+
+use Bench\Controller\ApiController;
+use Bench\Controller\CatalogController;
+use Bench\Database\Connection;
+use Bench\Http\Request;
+use Bench\Http\Response;
+use Bench\Repository\OrderRepository;
+use Bench\Repository\ProductRepository;
+use Bench\Routing\Router;
+use Bench\Session\Session;
+use Bench\View\View;
+
+final class Kernel
+{
+    private readonly Container $container;
+    private readonly Events $events;
+    private readonly Router $router;
+
+    public function __construct(public readonly array $config, string $templates)
+    {
+        $this->container = new Container();
+        $this->events = new Events($this->container);
+
+        $this->container->set(Connection::class, fn () => new Connection($config['database']));
+        $this->container->set(View::class, fn () => new View($templates));
+        $this->container->set(Session::class, fn () => new Session($config['sessions']));
+        $this->container->set(ProductRepository::class, fn (Container $c) => new ProductRepository($c->get(Connection::class)));
+        $this->container->set(OrderRepository::class, fn (Container $c) => new OrderRepository($c->get(Connection::class)));
+
+        $providers = array_map(fn (string $class) => new $class(), $config['providers']);
+        foreach ($providers as $provider) {
+            $provider->register($this->container);
+        }
+        foreach ($providers as $provider) {
+            $provider->boot($this->events);
+        }
+
+        $this->router = new Router();
+        $this->router->get('/', [CatalogController::class, 'home']);
+        $this->router->get('/categories/{slug}', [CatalogController::class, 'category']);
+        $this->router->get('/products/{id}', [CatalogController::class, 'product']);
+        $this->router->get('/api/products/{id}', [ApiController::class, 'product']);
+        $this->router->get('/api/orders/{id}', [ApiController::class, 'order']);
+        $this->router->get('/api/customers/{id}/orders', [ApiController::class, 'customerOrders']);
+    }
+
+    public function handle(Request $request): Response
+    {
+        $this->events->dispatch('kernel.request', $request);
+
+        $match = $this->router->match($request);
+        if ($match === null) {
+            $response = new Response('Not Found', 404, ['Content-Type' => 'text/plain']);
+        } else {
+            [$route, $params] = $match;
+            [$class, $method] = $route->handler;
+            $response = (new $class($this->container))->$method($request, ...$params);
+        }
+
+        $this->events->dispatch('kernel.response', $response);
+        return $response;
+    }
+}
@@ -0,0 +1,35 @@
+<?php
+
+namespace Bench\Repository;
+
+use Bench\Database\Connection;
+
+final class OrderRepository
+{
+    public function __construct(private readonly Connection $db)
+    {
+    }
+
+    public function find(int $id): ?array
+    {
+        $order = $this->db->fetchOne(
+            'SELECT o.*, c.name AS customer_name, c.email AS customer_email
+             FROM orders o JOIN customers c ON c.id = o.customer_id
+             WHERE o.id = ?',
+            [$id]
+        );
+        if ($order !== null) {
+            $order['items'] = json_decode($order['items'], true, flags: JSON_THROW_ON_ERROR);
+        }
+        return $order;
+    }
+
+    public function forCustomer(int $customerId, int $limit): array
+    {
+        return $this->db->fetchAll(
+            'SELECT id, status, created_at FROM orders
+             WHERE customer_id = ? ORDER BY created_at DESC LIMIT ?',
+            [$customerId, $limit]
+        );
+    }
+}
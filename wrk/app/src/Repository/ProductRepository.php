@@ -0,0 +1,91 @@
+<?php
+
+namespace Bench\Repository;
+
+use Bench\Database\Connection;
+
+final class ProductRepository
+{
+    private const COLUMNS = 'p.id, p.sku, p.name, p.price_cents, p.stock, p.category_id';
+
+    public function __construct(private readonly Connection $db)
+    {
+    }
+
+    public function find(int $id): ?array
+    {
+        $product = $this->db->fetchOne(
+            'SELECT p.*, c.name AS category_name, c.slug AS category_slug
+             FROM products p JOIN categories c ON c.id = p.category_id
+             WHERE p.id = ?',
+            [$id]
+        );
+        if ($product !== null) {
+            $product['attributes'] = json_decode($product['attributes'], true, flags: JSON_THROW_ON_ERROR);
+        }
+        return $product;
+    }
+
+    /** Products by id, keyed by id */
+    public function findMany(array $ids): array
+    {
+        if (!$ids) {
+            return [];
+        }
+        $placeholders = implode(', ', array_fill(0, count($ids), '?'));
+        $rows = $this->db->fetchAll(
+            'SELECT ' . self::COLUMNS . " FROM products p WHERE p.id IN ($placeholders)",
+            array_values($ids)
+        );
+        return array_column($rows, null, 'id');
+    }
+
+    public function categories(): array
+    {
+        return $this->db->fetchAll('SELECT id, name, slug FROM categories ORDER BY name');
+    }
+
+    public function category(string $slug): ?array
+    {
+        return $this->db->fetchOne('SELECT id, name, slug FROM categories WHERE slug = ?', [$slug]);
+    }
+
+    public function inCategory(int $categoryId, int $limit, int $excludeId = 0): array
+    {
+        return $this->db->fetchAll(
+            'SELECT ' . self::COLUMNS . ' FROM products p
+             WHERE p.category_id = ? AND p.id != ?
+             ORDER BY p.stock DESC LIMIT ?',
+            [$categoryId, $excludeId, $limit]
+        );
+    }
+
+    public function bestRated(int $limit): array
+    {
+        return $this->db->fetchAll(
+            'SELECT ' . self::COLUMNS . ', AVG(r.rating) AS rating
+             FROM products p JOIN reviews r ON r.product_id = p.id
+             GROUP BY p.id ORDER BY rating DESC, p.id LIMIT ?',
+            [$limit]
+        );
+    }
+
+    public function reviews(int $productId, int $limit): array
+    {
+        return $this->db->fetchAll(
+            'SELECT author, rating, body, created_at FROM reviews
+             WHERE product_id = ? ORDER BY created_at DESC LIMIT ?',
+            [$productId, $limit]
+        );
+    }
+
+    /** ['count' => n, 'average' => x] over all reviews of a product */
+    public function rating(int $productId): array
+    {
+        $row = $this->db->fetchOne(
+            'SELECT COUNT(*) AS count, AVG(rating) AS average FROM reviews WHERE product_id = ?',
+            [$productId]
+        );
+        return ['count' => (int) $row['count'], 'average' => round((float) $row['average'], 2)];
+    }
+}
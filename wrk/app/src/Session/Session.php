@@ -0,0 +1,38 @@
+<?php
+
+namespace Bench\Session;
+
+/** File-backed native PHP session, the id comes from the request */
+final class Session
+{
+    public function __construct(private readonly string $dir)
+    {
+    }
+
+    public function start(string $id): void
+    {
+        session_id($id);
+        session_start([
+            'save_path' => $this->dir,
+            'use_cookies' => 0,
+            'use_strict_mode' => 0,
+            'cache_limiter' => '',
+        ]);
+    }
+
+    public function get(string $key, mixed $default = null): mixed
+    {
+        return $_SESSION[$key] ?? $default;
+    }
+
+    public function set(string $key, mixed $value): void
+    {
+        $_SESSION[$key] = $value;
+    }
+
+    /** Write the session and release its lock */
+    public function close(): void
+    {
+        session_write_close();
+    }
+}
@@ -0,0 +1,39 @@
+<?php
+
+namespace Bench\View;
+
+final class View
+{
+    public function __construct(private readonly string $dir)
+    {
+    }
+
+    /** Render a template inside the layout */
+    public function render(string $template, array $data = []): string
+    {
+        return $this->partial('layout', ['content' => $this->partial($template, $data)] + $data);
+    }
+
+    public function partial(string $template, array $data = []): string
+    {
+        extract($data, EXTR_SKIP);
+        ob_start();
+        try {
+            require $this->dir . '/' . $template . '.php';
+            return ob_get_clean();
+        } catch (\Throwable $e) {
+            ob_end_clean();
+            throw $e;
+        }
+    }
+
+    public function e(mixed $value): string
+    {
+        return htmlspecialchars((string) $value, ENT_QUOTES | ENT_SUBSTITUTE, 'UTF-8');
+    }
+
+    public function money(int $cents): string
+    {
+        return '$' . number_format($cents / 100, 2);
+    }
+}
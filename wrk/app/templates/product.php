@@ -0,0 +1,44 @@
+<article class="product">
+    <p class="breadcrumb"><a href="/">Home</a> / <a href="/categories/<?= $this->e($product['category_slug']) ?>"><?= $this->e($product['category_name']) ?></a></p>
+    <h1><?= $this->e($product['name']) ?></h1>
+    <p class="sku"><?= $this->e($product['sku']) ?></p>
+    <p class="price"><?= $this->money($product['price_cents']) ?></p>
+    <p class="stock"><?= $product['stock'] > 0 ? $this->e($product['stock'] . ' in stock') : 'Out of stock' ?></p>
+    <p class="rating"><?= $rating['count'] ? $this->e($rating['average'] . ' / 5 from ' . $rating['count'] . ' reviews') : 'No reviews yet' ?></p>
+    <div class="description"><?= nl2br($this->e($product['description'])) ?></div>
+
+    <table class="attributes">
+<?php foreach ($product['attributes'] as $name => $value): ?>
+        <tr><th><?= $this->e(ucfirst($name)) ?></th><td><?= $this->e($value) ?></td></tr>
+<?php endforeach ?>
+    </table>
+</article>
+
+<section class="reviews">
+    <h2>Reviews</h2>
+<?php foreach ($reviews as $review): ?>
+<?= $this->partial('partials/review', ['review' => $review]) ?>
+<?php endforeach ?>
+</section>
+
+<?php if ($related): ?>
+<section class="related">
+    <h2>Related products</h2>
+    <div class="grid">
+<?php foreach ($related as $item): ?>
+<?= $this->partial('partials/product_card', ['product' => $item]) ?>
+<?php endforeach ?>
+    </div>
+</section>
+<?php endif ?>
+
+<?php if ($recent): ?>
+<section class="recent">
+    <h2>Recently viewed</h2>
+    <div class="grid">
+<?php foreach ($recent as $item): ?>
+<?= $this->partial('partials/product_card', ['product' => $item]) ?>
+<?php endforeach ?>
+    </div>
+</section>
+<?php endif ?>
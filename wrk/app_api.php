@@ -0,0 +1,12 @@
+<?php
+
+// Framework-style JSON API: autoloading, routing, SQLite queries and
+// JSON decoding/encoding of an order with its products.
+
+use Bench\Http\Request;
+
+$kernel = require __DIR__ . '/app/bootstrap.php';
+
+$path = $_GET['path'] ?? '/api/orders/' . mt_rand(1, $kernel->config['orders']);
+
+$kernel->handle(new Request('GET', $path, $_GET))->send();
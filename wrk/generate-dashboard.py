@@ -7,6 +7,7 @@ from pathlib import Path
 
 JSON_DIR = Path(__file__).parent / "json"
 DEFAULT_OUT_FILE = Path(__file__).parent / "benchmark-wrk.html"
+PROTOCOLS = ["h1-close", "h1", "h1-tls"]
 
 
 def parse_number(value: str) -> float:
@@ -43,21 +44,29 @@ def load_results():
     data = {}
     if not JSON_DIR.exists():
         return data
+    tagged, untagged = [], []
     for p in sorted(JSON_DIR.glob("*.json")):
         try:
             obj = json.loads(p.read_text(encoding="utf-8"))
         except Exception:
             continue
+        (tagged if "protocol" in obj else untagged).append((p, obj))
+
+    # Results written before the protocol matrix were plain keep-alive runs;
+    # they only fill in where no h1 result of the same run exists
+    for p, obj in tagged + untagged:
         script = Path(obj.get("script", "")).name or p.stem
         docker = obj.get("docker", "")
+        protocol = obj.get("protocol", "h1")
+        entries = data.setdefault(protocol, {}).setdefault(script, {})
+        if docker in entries:
+            continue
         metrics = obj.get("metrics", {})
         rps = parse_number(metrics.get("requests_per_sec", "nan"))
         avg_ms = parse_number(metrics.get("latency_avg", "nan"))
         p50_ms = parse_number(metrics.get("p50", "nan"))
         p99_ms = parse_number(metrics.get("p99", "nan"))
-        if script not in data:
-            data[script] = {}
-        data[script][docker] = {
+        entries[docker] = {
             "rps": rps,
             "avg_ms": avg_ms,
             "p50_ms": p50_ms,
@@ -132,8 +141,13 @@ def fmt_delta(delta: float) -> str:
     return f"{sign}{delta:.1f}%"
 
 
+def protocol_sort_key(protocol: str):
+    if protocol in PROTOCOLS:
+        return (PROTOCOLS.index(protocol), protocol)
+    return (len(PROTOCOLS), protocol)
+
+
 def generate_html(data):
-    scripts = sorted(data.keys())
     html = []
     html.append("""
 <!DOCTYPE html>
@@ -158,8 +172,20 @@ def generate_html(data):
     <p>Baseline: nginx. Green percentage = improvement vs baseline. Red = regression vs baseline.</p>
 """)
 
-    # Build a single comprehensive table
-    html.append("<h2>All metrics</h2>")
+    # Build one comprehensive table per protocol
+    for protocol in sorted(data.keys(), key=protocol_sort_key):
+        html.append(f"<h2>All metrics ({protocol})</h2>")
+        generate_table(html, data[protocol])
+
+    html.append("""
+  </body>
+  </html>
+""")
+    return "\n".join(html)
+
+
+def generate_table(html, data):
+    scripts = sorted(data.keys())
     html.append("<table>")
     # Header row 1: grouped by metric
     html.append(
@@ -293,12 +319,6 @@ def generate_html(data):
 
     html.append("</table>")
 
-    html.append("""
-  </body>
-  </html>
-""")
-    return "\n".join(html)
-
 
 def main():
     data = load_results()
@@ -0,0 +1,35 @@
+# Protocol and connection-reuse matrix shared by the benchmark scripts.
+#
+#   h1-close  HTTP/1.1, new connection per request
+#   h1        HTTP/1.1 keep-alive (the original setup)
+#   h1-tls    HTTP/1.1 over TLS
+#
+# wrk only speaks HTTP/1.1; use the vegeta harness for h2, h2c and h3.
+#
+# protocol_target <protocol> sets BASE_URL and the WRK_FLAGS array and
+# returns non-zero when wrk cannot drive the protocol.
+
+protocol_target() {
+    case "$1" in
+        h1-close)
+            BASE_URL="http://localhost:80"
+            WRK_FLAGS=(-H "Connection: close")
+            ;;
+        h1)
+            BASE_URL="http://localhost:80"
+            WRK_FLAGS=()
+            ;;
+        h1-tls)
+            BASE_URL="https://localhost:443"
+            WRK_FLAGS=()
+            ;;
+        h2|h2c|h3)
+            echo "Skipping $1: wrk only supports HTTP/1.1" >&2
+            return 1
+            ;;
+        *)
+            echo "Skipping unknown protocol: $1" >&2
+            return 1
+            ;;
+    esac
+}
@@ -5,6 +5,7 @@ set -e
 THREADS=${1:-8}
 CONNECTIONS=${2:-20}
 TIME=${3:-15}
+PROTOCOLS=${4:-"h1-close h1 h1-tls"}
 
 for dockerfile in *.Dockerfile; do
     basename="${dockerfile%.Dockerfile}"
@@ -12,10 +13,11 @@ for dockerfile in *.Dockerfile; do
     docker build -q -f "$dockerfile" -t "$image_name" \
         --build-arg WRK_THREADS="$THREADS" \
         --build-arg WRK_CONNECTIONS="$CONNECTIONS" \
-        --build-arg WRK_TIME="$TIME" .
+        --build-arg WRK_TIME="$TIME" \
+        --build-arg BENCH_PROTOCOLS="$PROTOCOLS" .
 done
 
-echo "Build complete (threads=$THREADS, connections=$CONNECTIONS, time=$TIME)"
+echo "Build complete (threads=$THREADS, connections=$CONNECTIONS, time=$TIME, protocols=$PROTOCOLS)"
 echo ""
 
 # Ensure output directory exists on host